@@ -3,9 +3,9 @@ Configuration classes for PIPECAST weather forecast processing.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, ClassVar, FrozenSet, Set, Sequence
 from enum import Enum
-from datetime import datetime
+from datetime import date
 
 
 class WeatherDataset(Enum):
@@ -26,11 +26,17 @@ class ForecastConfig:
     analysis workflow.
     """
     
+    _validated_dates: ClassVar[Set[str]] = set()
+    """Date strings already validated by any config instance."""
+    
+    _enum_fields: ClassVar[FrozenSet[str]] = frozenset({"weather_dataset"})
+    """Fields serialized by their enum value in ``to_dict``."""
+    
     # Date and time parameters
-    forecast_dates: List[str] = field(default_factory=list)
+    forecast_dates: Sequence[str] = ()
     """List of forecast dates in YYYY-MM-DD format."""
     
-    fxx_list: List[int] = field(default_factory=lambda: [0, 4, 8, 12, 16, 20, 24])
+    fxx_list: Sequence[int] = (0, 4, 8, 12, 16, 20, 24)
     """Forecast hours to evaluate (e.g., [0, 4, 8, 12, 16, 20, 24])."""
     
     # Weather dataset parameters
@@ -47,23 +53,30 @@ class ForecastConfig:
     """Variable name in xarray dataset."""
     
     # Threshold parameters
-    thresholds: List[float] = field(default_factory=lambda: [5, 39, 50, 100, 254, 255])
+    thresholds: Sequence[float] = (5, 39, 50, 100, 254, 255)
     """Precipitation thresholds in mm."""
     
-    threshold_bins: List[Tuple[float, float]] = field(
-        default_factory=lambda: [(0, 5), (6, 39), (40, 50), (51, 100), (100, 254), (255, float('inf'))]
+    threshold_bins: Sequence[Tuple[float, float]] = (
+        (0, 5), (6, 39), (40, 50), (51, 100), (100, 254), (255, float('inf'))
     )
     """Threshold bins for ensemble probability calculation."""
     
-    bin_labels: List[str] = field(
-        default_factory=lambda: ["0-5", "6-39", "40-50", "51-100", "100-254", "255+"]
-    )
+    bin_labels: Sequence[str] = ("0-5", "6-39", "40-50", "51-100", "100-254", "255+")
     """Labels for threshold bins."""
     
     # Processing methods
-    forecast_methods: List[str] = field(default_factory=lambda: ["standard", "enhanced"])
+    forecast_methods: Sequence[str] = ("standard", "enhanced")
     """Processing methods: 'standard' (AOIs only) or 'enhanced' (with census/watershed)."""
     
+    n_workers: int = 1
+    """Worker processes for independent (date, forecast hour) jobs; 1 runs serially."""
+    
+    prefetch_depth: int = 2
+    """Forecasts fetched ahead of processing in serial runs; 0 disables prefetching."""
+    
+    batch_downloads: bool = True
+    """Download all forecast hours of a date concurrently (FastHerbie) in serial runs."""
+    
     # Spatial parameters
     target_crs: str = "EPSG:4326"
     """Target coordinate reference system."""
@@ -79,10 +92,10 @@ class ForecastConfig:
     
     # Enhanced layer parameters
     use_census: bool = True
-    """Whether to use census population data."""
+    """Whether to use census population data (also the land boundary for ``clip_to_land``)."""
     
     use_watershed: bool = True
-    """Whether to use watershed data."""
+    """Whether to use watershed data (loaded only when 'enhanced' is in ``forecast_methods``)."""
     
     custom_layers: Dict[str, str] = field(default_factory=dict)
     """Custom enhanced layers: {layer_name: file_path}."""
@@ -92,7 +105,10 @@ class ForecastConfig:
     """Base output directory."""
     
     save_aois: bool = True
-    """Whether to save individual AOI GeoJSON files."""
+    """Whether to save individual AOI files."""
+    
+    aoi_format: str = "geojson"
+    """AOI file format: 'geojson', 'geojsonseq' (one feature per line) or 'parquet' (requires pyarrow)."""
     
     save_ensemble: bool = True
     """Whether to generate ensemble probability products."""
@@ -118,34 +134,48 @@ class ForecastConfig:
         
         # Validate dates
         for date_str in self.forecast_dates:
+            if date_str in ForecastConfig._validated_dates:
+                continue
             try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
+                # fromisoformat also accepts YYYYMMDD and ISO week dates, so
+                # only a value it formats back unchanged is YYYY-MM-DD
+                if date.fromisoformat(date_str).isoformat() != date_str:
+                    raise ValueError
+            except (TypeError, ValueError):
                 raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
+            ForecastConfig._validated_dates.add(date_str)
         
         # Validate bins and labels match
         if len(self.threshold_bins) != len(self.bin_labels):
             raise ValueError("threshold_bins and bin_labels must have same length")
         
+        if self.n_workers < 1:
+            raise ValueError("n_workers must be at least 1")
+        
+        if self.prefetch_depth < 0:
+            raise ValueError("prefetch_depth cannot be negative")
+        
+        if self.aoi_format not in ("geojson", "geojsonseq", "parquet"):
+            raise ValueError(
+                f"Invalid aoi_format: {self.aoi_format}. Use 'geojson', 'geojsonseq' or 'parquet'"
+            )
+        
         # Convert string to enum if needed
         if isinstance(self.weather_dataset, str):
             self.weather_dataset = WeatherDataset(self.weather_dataset.lower())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, Enum):
-                result[key] = value.value
-            elif isinstance(value, (list, tuple)) and value and isinstance(value[0], Enum):
-                result[key] = [v.value for v in value]
-            else:
-                result[key] = value
+        result = dict(self.__dict__)
+        for key in self._enum_fields:
+            result[key] = result[key].value
         return result
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'ForecastConfig':
         """Create config from dictionary."""
+        config_dict = dict(config_dict)
+        
         # Convert weather_dataset string to enum
         if 'weather_dataset' in config_dict and isinstance(config_dict['weather_dataset'], str):
             config_dict['weather_dataset'] = WeatherDataset(config_dict['weather_dataset'])
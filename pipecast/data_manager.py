@@ -2,13 +2,329 @@
 Data management for PIPECAST enhanced layers.
 """
 
+import json
 import os
+import shutil
+import threading
+import warnings
 import zipfile
-from pathlib import Path
-from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Optional, Dict, Tuple, Sequence, Union, Any
+import numpy as np
 import geopandas as gpd
-import requests
+import shapely
+import urllib3
+from pyproj import CRS, Transformer
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+# Optional dependencies
+try:
+    import pyogrio
+    PYOGRIO_AVAILABLE = True
+except ImportError:
+    PYOGRIO_AVAILABLE = False
+
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# File suffixes written for AOI outputs, by ForecastConfig.aoi_format
+AOI_SUFFIXES = {"geojson": ".geojson", "geojsonseq": ".geojsonl", "parquet": ".parquet"}
+
+# Files at least this large are fetched with parallel range requests
+PARALLEL_DOWNLOAD_MIN_BYTES = 32 * 1024 * 1024
+
+# CRS objects built once instead of re-parsing EPSG codes at every call site
+WGS84 = CRS.from_epsg(4326)
+ALBERS_CONUS = CRS.from_epsg(5070)
+WEB_MERCATOR = CRS.from_epsg(3857)
+
+# Projection of the published Zenodo layers (by file name), used when their
+# coordinates turn out to be projected, so the .prj need not be inspected
+KNOWN_DATASETS = {
+    "National_block_groups_with_pop.zip": {"crs": ALBERS_CONUS},
+    "National_Huc_12_preprocessed.zip": {"crs": ALBERS_CONUS},
+}
+
+# Copy buffer for streamed downloads
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Upper bound on threads loading enhanced layers concurrently
+MAX_LAYER_WORKERS = 8
+
+# Attribute columns read from the national layers by default; everything
+# else in the DBF is skipped. Missing names are ignored.
+CENSUS_COLUMNS = ("id", "GEOID", "U7H001", "population", "Population", "POP", "POPULATION")
+WATERSHED_COLUMNS = ("id", "HUC12")
+
+
+# Layers already parsed in this process, shared by every DataManager so that
+# repeated ForecastProcessor instances skip the shapefile read + reprojection.
+# Keyed by (layer kind, source URL or path).
+_LAYER_CACHE: Dict[Tuple[str, str], gpd.GeoDataFrame] = {}
+
+
+def _get_cached_layer(kind: str, source: str) -> Optional[gpd.GeoDataFrame]:
+    """Return a shallow copy of a memoized layer, or None if not loaded yet."""
+    gdf = _LAYER_CACHE.get((kind, str(source)))
+    if gdf is None:
+        return None
+    return gdf.copy(deep=False)
+
+
+def _set_cached_layer(kind: str, source: str, gdf: gpd.GeoDataFrame):
+    """Memoize a parsed layer for the rest of the session."""
+    _LAYER_CACHE[(kind, str(source))] = gdf
+
+
+# Cached downloads already checked against their source in this process
+_VALIDATED_DOWNLOADS: set = set()
+
+
+def clear_layer_cache():
+    """Drop all layers memoized in this process (e.g. to free memory)."""
+    _LAYER_CACHE.clear()
+
+
+@lru_cache(maxsize=16)
+def _cached_transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Build (once per CRS pair) the transformer behind ``_to_crs_cached``."""
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+def _to_crs_cached(gdf: gpd.GeoDataFrame, dst_crs) -> gpd.GeoDataFrame:
+    """
+    Reproject like ``gdf.to_crs(dst_crs)``, reusing a cached transformer.
+    
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        Data with a CRS set
+    dst_crs : str or CRS
+        Target CRS
+        
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Reprojected copy
+    """
+    dst_crs = CRS.from_user_input(dst_crs)
+    if gdf.crs is None:
+        raise ValueError("Cannot transform naive geometries. Please set a crs on the object first.")
+    
+    transformer = _cached_transformer(gdf.crs.to_wkt(), dst_crs.to_wkt())
+    
+    def transform_coords(coords):
+        return np.column_stack(transformer.transform(*coords.T))
+    
+    geoms = np.asarray(gdf.geometry.values)
+    has_z = bool(shapely.has_z(geoms).any())
+    geoms = shapely.transform(geoms, transform_coords, include_z=has_z)
+    result = gdf.copy()
+    result[gdf.geometry.name] = gpd.GeoSeries(geoms, index=gdf.index, crs=dst_crs)
+    return result.set_crs(dst_crs, allow_override=True)
+
+
+def _preallocate(f, size: int):
+    """Reserve ``size`` bytes for an open file up front (sparse if fallocate is unavailable)."""
+    if size <= 0:
+        return
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    f.truncate(size)
+
+
+def _sample_bounds(gdf: gpd.GeoDataFrame, max_samples: int = 1000) -> np.ndarray:
+    """
+    Bounds of an evenly strided sample of geometries.
+    
+    Enough to tell degrees from projected meters without a full GEOS scan
+    of national layers.
+    """
+    geoms = np.asarray(gdf.geometry.values)
+    step = max(len(geoms) // max_samples, 1)
+    # One vectorized GEOS pass over the sample
+    return shapely.total_bounds(geoms[::step])
+
+
+def _subset_layer(
+    gdf: gpd.GeoDataFrame,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    columns: Optional[Sequence[str]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Features of a loaded EPSG:4326 layer in a bbox, with only the given columns.
+    
+    Columns missing from the layer are ignored, as when reading from file;
+    the geometry column is always kept.
+    """
+    if bbox is not None:
+        gdf = gdf.cx[bbox[0]:bbox[2], bbox[1]:bbox[3]]
+    if columns is not None:
+        geometry = gdf.geometry.name
+        keep = [c for c in gdf.columns if c in columns or c == geometry]
+        if len(keep) < len(gdf.columns):
+            gdf = gdf[keep]
+    return gdf
+
+
+def _read_vector(
+    path,
+    engine: Optional[str] = "pyogrio",
+    columns: Optional[Sequence[str]] = None,
+    **kwargs
+) -> gpd.GeoDataFrame:
+    """
+    Read a vector file, using pyogrio when requested and installed.
+    
+    Falls back to geopandas' default engine (Fiona on older installs)
+    when pyogrio is not available. ``columns`` limits the attribute
+    columns read (geometry is always kept); names not in the file are
+    ignored, and pyogrio skips decoding the rest entirely.
+    """
+    if engine == "pyogrio" and not PYOGRIO_AVAILABLE:
+        engine = None
+    if engine is not None:
+        kwargs["engine"] = engine
+    if columns is not None and engine == "pyogrio":
+        fields = set(pyogrio.read_info(path)["fields"])
+        kwargs["columns"] = [col for col in columns if col in fields]
+    gdf = gpd.read_file(path, **kwargs)
+    if columns is not None and engine != "pyogrio":
+        keep = [col for col in gdf.columns if col in columns]
+        gdf = gdf[keep + [gdf.geometry.name]]
+    return gdf
+
+
+def _is_empty_geojsonseq(path: Path) -> bool:
+    """
+    Whether a path is a GeoJSONSeq AOI file written without features.
+    
+    GDAL writes an empty GeoJSONSeq layer as a 0-byte file that it cannot
+    open again; GeoJSONSeq is always EPSG:4326, so nothing else is lost.
+    """
+    return path.suffix == AOI_SUFFIXES["geojsonseq"] and path.stat().st_size == 0
+
+
+def write_aoi_file(gdf: gpd.GeoDataFrame, path: Path):
+    """
+    Write an AOI GeoDataFrame, choosing the format from the file suffix.
+    
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        AOIs to write
+    path : Path
+        Output path ending in ``.geojson``, ``.geojsonl`` (one feature
+        per line) or ``.parquet``
+    """
+    path = Path(path)
+    if path.suffix == AOI_SUFFIXES["parquet"]:
+        gdf.to_parquet(path)
+        return
+    
+    driver = "GeoJSONSeq" if path.suffix == AOI_SUFFIXES["geojsonseq"] else "GeoJSON"
+    if PYOGRIO_AVAILABLE:
+        gdf.to_file(path, driver=driver, engine="pyogrio")
+    else:
+        gdf.to_file(path, driver=driver)
+
+
+def read_aoi_file(path: Path, columns: Optional[Sequence[str]] = None) -> gpd.GeoDataFrame:
+    """
+    Read an AOI file written by ``write_aoi_file``.
+    
+    Parameters
+    ----------
+    path : Path
+        AOI file (``.geojson``, ``.geojsonl`` or ``.parquet``)
+    columns : sequence of str, optional
+        Attribute columns to read (geometry is always kept); an empty
+        sequence reads geometry only
+        
+    Returns
+    -------
+    gpd.GeoDataFrame
+        AOIs
+    """
+    path = Path(path)
+    if path.suffix == AOI_SUFFIXES["parquet"]:
+        gdf = gpd.read_parquet(path)
+        if columns is not None:
+            gdf = gdf[[col for col in gdf.columns if col in columns] + [gdf.geometry.name]]
+        return gdf
+    if _is_empty_geojsonseq(path):
+        return gpd.GeoDataFrame(geometry=[], crs=WGS84)
+    return _read_vector(path, columns=columns)
+
+
+def read_aoi_feature_count(path: Path) -> Optional[int]:
+    """
+    Number of AOIs in a file, read from its metadata without decoding them.
+    
+    Parameters
+    ----------
+    path : Path
+        AOI file (``.geojson``, ``.geojsonl`` or ``.parquet``)
+        
+    Returns
+    -------
+    int or None
+        Feature count, or None if it cannot be read cheaply (parquet
+        files, or pyogrio not installed)
+    """
+    path = Path(path)
+    if path.suffix == AOI_SUFFIXES["parquet"] or not PYOGRIO_AVAILABLE:
+        return None
+    if _is_empty_geojsonseq(path):
+        return 0
+    count = pyogrio.read_info(path).get("features", -1)
+    return count if count >= 0 else None
+
+
+def read_aoi_bounds(path: Path) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Extent of an AOI file in EPSG:4326, without building its geometries.
+    
+    Parameters
+    ----------
+    path : Path
+        AOI file (``.geojson``, ``.geojsonl`` or ``.parquet``)
+        
+    Returns
+    -------
+    tuple or None
+        (west, south, east, north), or None if the file has no features
+    """
+    path = Path(path)
+    if path.suffix == AOI_SUFFIXES["parquet"] or not PYOGRIO_AVAILABLE:
+        gdf = read_aoi_file(path)
+        if gdf.empty:
+            return None
+        return tuple(float(v) for v in gdf.to_crs(WGS84).total_bounds)
+    
+    if _is_empty_geojsonseq(path):
+        return None
+    
+    # GDAL computes the extent in C; no Python geometry objects are made
+    info = pyogrio.read_info(path, force_total_bounds=True)
+    bounds = info.get("total_bounds")
+    if info.get("features", 0) == 0 or bounds is None:
+        return None
+    
+    file_crs = CRS.from_user_input(info["crs"]) if info.get("crs") else WGS84
+    if file_crs.to_epsg() != 4326:
+        bounds = Transformer.from_crs(file_crs, WGS84, always_xy=True).transform_bounds(*bounds)
+    return tuple(float(v) for v in bounds)
 
 
 class DataManager:
@@ -18,7 +334,7 @@ class DataManager:
     Downloads from Zenodo and caches locally.
     """
     
-    def __init__(self, cache_dir: str = "./pipecast_data"):
+    def __init__(self, cache_dir: str = "./pipecast_data", engine: Optional[str] = "pyogrio"):
         """
         Initialize DataManager.
         
@@ -26,13 +342,25 @@ class DataManager:
         ----------
         cache_dir : str
             Directory to cache downloaded data
+        engine : str, optional
+            Vector I/O engine for reading layers ("pyogrio" or "fiona");
+            pyogrio falls back to the geopandas default if not installed
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.engine = engine
+        
+        # One connection pool for HEAD probes, streams and range requests
+        self._http = urllib3.PoolManager(retries=urllib3.Retry(3), maxsize=8)
         
         self.census_gdf: Optional[gpd.GeoDataFrame] = None
         self.watershed_gdf: Optional[gpd.GeoDataFrame] = None
         self.custom_layers: Dict[str, gpd.GeoDataFrame] = {}
+        
+        # Layer metadata from open_census/open_watershed (no geometries read)
+        self.census_info: Optional[Dict[str, Any]] = None
+        self.watershed_info: Optional[Dict[str, Any]] = None
+        self._layer_urls: Dict[str, str] = {}
     
     def download_file(self, url: str, filename: str) -> Path:
         """
@@ -51,36 +379,231 @@ class DataManager:
             Path to downloaded file
         """
         filepath = self.cache_dir / filename
+        meta_path = filepath.with_name(filepath.name + ".meta.json")
+        
+        # Reuse the cached file once per process if it still matches the source
+        if filepath.exists() and (url, str(filepath)) in _VALIDATED_DOWNLOADS:
+            print(f"✓ File already cached: {filepath}")
+            return filepath
+        
+        total_size, accepts_ranges, etag = self._probe_download(url)
         
-        # Check if already downloaded
         if filepath.exists():
+            if self._cached_download_valid(filepath, meta_path, total_size, etag):
+                _VALIDATED_DOWNLOADS.add((url, str(filepath)))
+                print(f"✓ File already cached: {filepath}")
+                return filepath
+            if total_size == 0:
+                # The source could not be checked; a cache that cannot be
+                # verified beats no data at all
+                warnings.warn(f"Could not check {filename} against {url}; using the cached copy")
+                return filepath
+            # The cached file stays in place until the new download replaces it
+            print(f"Cached {filename} is incomplete or out of date; downloading again")
+        
+        # Large files from servers that support ranges download in segments
+        if accepts_ranges and total_size >= PARALLEL_DOWNLOAD_MIN_BYTES:
+            self.download_file_parallel(url, filename, total_size=total_size, overwrite=True)
+        else:
+            print(f"Downloading {filename}...")
+            self._download_stream(url, filepath)
+            print(f"✓ Downloaded: {filepath}")
+        
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "content_length": total_size,
+            "etag": etag,
+            "size": filepath.stat().st_size
+        }))
+        _VALIDATED_DOWNLOADS.add((url, str(filepath)))
+        return filepath
+    
+    @staticmethod
+    def _cached_download_valid(
+        filepath: Path,
+        meta_path: Path,
+        total_size: int,
+        etag: Optional[str]
+    ) -> bool:
+        """
+        Check a cached download against its sidecar metadata and a fresh HEAD.
+        
+        A file whose size differs from what was written is treated as
+        partial. A changed Content-Length or ETag means the source was
+        updated. When the server could not be reached (size 0, no ETag) the
+        file is kept as long as its sidecar shows it is complete.
+        """
+        file_size = filepath.stat().st_size
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            # Cached before sidecars existed: only the size can be compared,
+            # and without a remote size a partial file cannot be ruled out
+            valid = total_size > 0 and total_size == file_size
+            if valid:
+                meta_path.write_text(json.dumps({
+                    "content_length": total_size, "etag": etag, "size": file_size
+                }))
+            return valid
+        
+        if file_size != meta.get("size"):
+            return False
+        if total_size and total_size != meta.get("content_length"):
+            return False
+        if etag and meta.get("etag") and etag != meta["etag"]:
+            return False
+        return True
+    
+    def _probe_download(self, url: str) -> Tuple[int, bool, Optional[str]]:
+        """Return (content length, whether byte ranges are supported, ETag) from a HEAD request."""
+        try:
+            response = self._http.request('HEAD', url, timeout=30)
+        except urllib3.exceptions.HTTPError:
+            return 0, False, None
+        if response.status >= 400:
+            return 0, False, None
+        
+        total_size = int(response.headers.get('content-length', 0))
+        accepts_ranges = response.headers.get('accept-ranges', '').lower() == 'bytes'
+        return total_size, accepts_ranges, response.headers.get('etag')
+    
+    def _download_stream(self, url: str, filepath: Path):
+        """
+        Download over a single streamed connection.
+        
+        Streams into a ``.part`` file that is renamed into place only once
+        the transfer has completed.
+        """
+        part_path = filepath.with_name(filepath.name + ".part")
+        response = self._http.request('GET', url, preload_content=False)
+        try:
+            if response.status >= 400:
+                raise urllib3.exceptions.HTTPError(f"HTTP {response.status} for {url}")
+            
+            total_size = int(response.headers.get('content-length', 0))
+            
+            with open(part_path, 'wb') as f, tqdm(
+                total=total_size,
+                unit='B',
+                unit_scale=True,
+                desc=filepath.name
+            ) as pbar:
+                _preallocate(f, total_size)
+                # urllib3 undoes any Content-Encoding while copying in 1 MiB blocks
+                shutil.copyfileobj(
+                    response, CallbackIOWrapper(pbar.update, f, 'write'), DOWNLOAD_CHUNK_BYTES
+                )
+                # Decoded content may not match the advertised length
+                f.truncate(f.tell())
+            os.replace(part_path, filepath)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        finally:
+            response.release_conn()
+    
+    def download_file_parallel(
+        self,
+        url: str,
+        filename: str,
+        n_conn: int = 8,
+        total_size: Optional[int] = None,
+        overwrite: bool = False
+    ) -> Path:
+        """
+        Download a file as concurrent HTTP range requests.
+        
+        Each connection writes its byte range at the matching offset of a
+        preallocated ``.part`` file, which is renamed into place once every
+        range has arrived. Falls back to a single stream if the server does
+        not honour range requests.
+        
+        Parameters
+        ----------
+        url : str
+            URL to download from
+        filename : str
+            Name for saved file
+        n_conn : int
+            Number of concurrent connections
+        total_size : int, optional
+            Content length, if already known from a HEAD request
+        overwrite : bool
+            Download even if the file is already cached; the cached copy is
+            only replaced once the new one is complete
+            
+        Returns
+        -------
+        Path
+            Path to downloaded file
+        """
+        filepath = self.cache_dir / filename
+        
+        if filepath.exists() and not overwrite:
             print(f"✓ File already cached: {filepath}")
             return filepath
         
+        if total_size is None:
+            total_size, accepts_ranges, _ = self._probe_download(url)
+            if not accepts_ranges:
+                total_size = 0
+        
         print(f"Downloading {filename}...")
         
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        if total_size <= 0:
+            self._download_stream(url, filepath)
+            print(f"✓ Downloaded: {filepath}")
+            return filepath
         
-        total_size = int(response.headers.get('content-length', 0))
+        part_path = filepath.with_name(filepath.name + ".part")
+        with open(part_path, 'wb') as f:
+            _preallocate(f, total_size)
         
-        with open(filepath, 'wb') as f, tqdm(
-            total=total_size,
-            unit='B',
-            unit_scale=True,
-            desc=filename
-        ) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    pbar.update(len(chunk))
+        step = -(-total_size // max(1, n_conn))
+        ranges = [(lo, min(lo + step, total_size) - 1) for lo in range(0, total_size, step)]
+        lock = threading.Lock()
+        
+        with tqdm(total=total_size, unit='B', unit_scale=True, desc=filename) as pbar:
+            def fetch_range(byte_range):
+                lo, hi = byte_range
+                response = self._http.request(
+                    'GET', url, headers={'Range': f'bytes={lo}-{hi}'},
+                    preload_content=False, timeout=60
+                )
+                try:
+                    if response.status != 206:
+                        raise RuntimeError(f"server ignored the range request (HTTP {response.status})")
+                    
+                    with open(part_path, 'r+b') as f:
+                        f.seek(lo)
+                        for chunk in response.stream(DOWNLOAD_CHUNK_BYTES):
+                            f.write(chunk)
+                            with lock:
+                                pbar.update(len(chunk))
+                finally:
+                    response.release_conn()
+            
+            try:
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    list(executor.map(fetch_range, ranges))
+            except Exception as e:
+                part_path.unlink(missing_ok=True)
+                warnings.warn(f"Parallel download failed ({e}); retrying as a single stream")
+                self._download_stream(url, filepath)
+                print(f"✓ Downloaded: {filepath}")
+                return filepath
+        
+        os.replace(part_path, filepath)
         
         print(f"✓ Downloaded: {filepath}")
         return filepath
     
-    def extract_zip(self, zip_path: Path) -> Path:
+    def zip_shapefile_path(self, zip_path: Path) -> str:
         """
-        Extract ZIP file.
+        Locate the shapefile inside a ZIP for reading through GDAL's /vsizip/.
+        
+        GDAL reads the .shp/.shx/.dbf/.prj members straight from the
+        archive, so nothing is extracted to disk.
         
         Parameters
         ----------
@@ -89,116 +612,419 @@ class DataManager:
             
         Returns
         -------
-        Path
-            Directory containing extracted files
+        str
+            ``/vsizip/`` path of the first shapefile in the archive
         """
-        extract_dir = zip_path.parent / zip_path.stem
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            shp_names = sorted(n for n in zip_ref.namelist() if n.lower().endswith(".shp"))
         
-        if extract_dir.exists():
-            print(f"✓ Already extracted: {extract_dir}")
-            return extract_dir
+        if not shp_names:
+            raise FileNotFoundError(f"No shapefile found in {zip_path}")
         
-        print(f"Extracting {zip_path.name}...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
+        return f"/vsizip/{Path(zip_path).resolve().as_posix()}/{shp_names[0]}"
+    
+    @staticmethod
+    def _read_prj_text(shp_path) -> Optional[str]:
+        """Return the .prj text next to a shapefile (on disk or in /vsizip/), if any."""
+        shp_path = str(shp_path)
+        
+        if shp_path.startswith("/vsizip/"):
+            zip_part, _, inner = shp_path[len("/vsizip/"):].partition(".zip/")
+            prj_name = str(PurePosixPath(inner).with_suffix(".prj"))
+            with zipfile.ZipFile(zip_part + ".zip", 'r') as zip_ref:
+                if prj_name not in zip_ref.namelist():
+                    return None
+                return zip_ref.read(prj_name).decode("utf-8", errors="replace")
         
-        print(f"✓ Extracted to: {extract_dir}")
-        return extract_dir
+        prj_file = Path(shp_path).with_suffix('.prj')
+        if not prj_file.exists():
+            return None
+        return prj_file.read_text()
     
-    def download_census_data(self, url: str) -> gpd.GeoDataFrame:
+    @classmethod
+    def _detect_prj_crs(cls, shp_path) -> CRS:
         """
-        Download and load census data.
+        Guess the real projection of a shapefile with wrong CRS metadata.
+        
+        Parameters
+        ----------
+        shp_path : Path or str
+            Path to the shapefile (may be a ``/vsizip/`` path)
+            
+        Returns
+        -------
+        CRS
+            Detected projection, defaulting to the US census Albers
+            projection (EPSG:5070)
+        """
+        prj_text = cls._read_prj_text(shp_path)
+        if prj_text is not None:
+            if 'Albers' in prj_text or 'EPSG",5070' in prj_text:
+                return ALBERS_CONUS
+            if 'Web_Mercator' in prj_text or 'EPSG",3857' in prj_text:
+                return WEB_MERCATOR
+        return ALBERS_CONUS
+    
+    @classmethod
+    def _assumed_projected_crs(cls, url: str, shp_path) -> CRS:
+        """Projected CRS of a layer from ``KNOWN_DATASETS``, else from its .prj."""
+        known = KNOWN_DATASETS.get(PurePosixPath(url.split("?")[0]).name)
+        if known is not None:
+            return known["crs"]
+        return cls._detect_prj_crs(shp_path)
+    
+    def _native_bbox(
+        self,
+        shp_path: Path,
+        bbox: Optional[Tuple[float, float, float, float]],
+        projected_crs: CRS
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Express a lon/lat bbox in a layer's stored coordinates for read-time filtering.
+        
+        Parameters
+        ----------
+        shp_path : Path
+            Layer file
+        bbox : tuple, optional
+            (west, south, east, north) in EPSG:4326
+        projected_crs : CRS
+            CRS assumed when the stored bounds are clearly not degrees
+            (matching the CRS fix applied after loading)
+            
+        Returns
+        -------
+        tuple or None
+            Bbox in the file's coordinates, or None to read every feature
+        """
+        if bbox is None or not PYOGRIO_AVAILABLE or self.engine != "pyogrio":
+            return None
+        
+        info = pyogrio.read_info(shp_path)
+        stored_crs = CRS.from_user_input(info["crs"]) if info.get("crs") else None
+        bounds = info.get("total_bounds")
+        if stored_crs is not None and not stored_crs.is_geographic:
+            file_crs = stored_crs
+        elif bounds is not None and (abs(bounds[0]) > 200 or abs(bounds[2]) > 200):
+            file_crs = CRS.from_user_input(projected_crs)
+        elif stored_crs is not None:
+            file_crs = stored_crs
+        else:
+            return tuple(bbox)
+        
+        if file_crs.to_epsg() == 4326:
+            return tuple(bbox)
+        
+        transformer = Transformer.from_crs(WGS84, file_crs, always_xy=True)
+        return transformer.transform_bounds(*bbox)
+    
+    def _normalized_layer_path(self, kind: str) -> Path:
+        """Cache file for a layer already converted to EPSG:4326."""
+        suffix = ".parquet" if PYARROW_AVAILABLE else ".fgb"
+        return self.cache_dir / f"{kind}_wgs84{suffix}"
+    
+    def _read_normalized_layer(
+        self,
+        kind: str,
+        zip_path: Path,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ) -> Optional[gpd.GeoDataFrame]:
+        """
+        Read a layer persisted by ``_write_normalized_layer``.
+        
+        Parameters
+        ----------
+        kind : str
+            Layer kind ('census' or 'watershed')
+        zip_path : Path
+            Source archive; a normalized file older than it is ignored
+        bbox : tuple, optional
+            (west, south, east, north) in EPSG:4326, pushed down to
+            FlatGeobuf's spatial index
+            
+        Returns
+        -------
+        gpd.GeoDataFrame or None
+            Layer in EPSG:4326, or None if no usable normalized file exists
+        """
+        path = self._normalized_layer_path(kind)
+        if not path.exists() or path.stat().st_mtime < Path(zip_path).stat().st_mtime:
+            return None
+        
+        print(f"Loading {kind} data from: {path}")
+        try:
+            if path.suffix == ".parquet":
+                return gpd.read_parquet(path)
+            if bbox is not None:
+                return _read_vector(path, self.engine, bbox=tuple(bbox))
+            return _read_vector(path, self.engine)
+        except Exception as e:
+            warnings.warn(f"Could not read normalized {kind} layer ({e}); re-reading shapefile")
+            return None
+    
+    def _write_normalized_layer(self, kind: str, gdf: gpd.GeoDataFrame):
+        """
+        Persist a layer converted to EPSG:4326 so later runs skip the
+        shapefile read and reprojection.
+        
+        Written as GeoParquet when pyarrow is installed, otherwise as
+        FlatGeobuf (with its packed R-tree for bbox reads).
+        """
+        path = self._normalized_layer_path(kind)
+        # Keep the real suffix: GDAL picks the layout from it (a FlatGeobuf
+        # name without .fgb becomes a directory)
+        part_path = path.with_name(f"{path.stem}.part{path.suffix}")
+        try:
+            if path.suffix == ".parquet":
+                gdf.to_parquet(part_path, compression="zstd")
+            elif PYOGRIO_AVAILABLE:
+                gdf.to_file(part_path, driver="FlatGeobuf", engine="pyogrio")
+            else:
+                gdf.to_file(part_path, driver="FlatGeobuf")
+            os.replace(part_path, path)
+        except Exception as e:
+            part_path.unlink(missing_ok=True)
+            warnings.warn(f"Could not cache normalized {kind} layer: {e}")
+    
+    def _open_layer(self, kind: str, url: str, filename: str) -> Dict[str, Any]:
+        """Download a layer and read its metadata without materializing features."""
+        if not PYOGRIO_AVAILABLE:
+            raise ImportError("pyogrio is required to open layers lazily")
+        
+        zip_path = self.download_file(url, filename)
+        path = self._normalized_layer_path(kind)
+        if not path.exists() or path.stat().st_mtime < zip_path.stat().st_mtime:
+            path = self.zip_shapefile_path(zip_path)
+        
+        info = dict(pyogrio.read_info(path))
+        info["path"] = str(path)
+        self._layer_urls[kind] = url
+        return info
+    
+    def open_census(self, url: str) -> Dict[str, Any]:
+        """
+        Open census data without reading its features.
         
         Parameters
         ----------
         url : str
             Zenodo URL for census data
             
+        Returns
+        -------
+        dict
+            ``pyogrio.read_info`` metadata (crs, fields, features,
+            total_bounds in the file's coordinates) plus the source ``path``
+        """
+        self.census_info = self._open_layer("census", url, "census_data.zip")
+        return self.census_info
+    
+    def open_watershed(self, url: str) -> Dict[str, Any]:
+        """
+        Open watershed data without reading its features.
+        
+        Parameters
+        ----------
+        url : str
+            Zenodo URL for watershed data
+            
+        Returns
+        -------
+        dict
+            ``pyogrio.read_info`` metadata plus the source ``path``
+        """
+        self.watershed_info = self._open_layer("watershed", url, "watershed_data.zip")
+        return self.watershed_info
+    
+    def read_census_subset(
+        self,
+        bbox: Tuple[float, float, float, float],
+        columns: Optional[Sequence[str]] = CENSUS_COLUMNS
+    ) -> gpd.GeoDataFrame:
+        """
+        Read the census features in a bbox from a layer opened with ``open_census``.
+        
+        Parameters
+        ----------
+        bbox : tuple
+            (west, south, east, north) in EPSG:4326
+        columns : sequence of str, optional
+            Attribute columns to read; None reads all columns
+            
         Returns
         -------
         gpd.GeoDataFrame
-            Census data
+            Census features in EPSG:4326
         """
-        if self.census_gdf is not None:
-            return self.census_gdf
+        if "census" not in self._layer_urls:
+            raise RuntimeError("Call open_census() before read_census_subset()")
+        return self.download_census_data(self._layer_urls["census"], bbox=bbox, columns=columns)
+    
+    def read_watershed_subset(
+        self,
+        bbox: Tuple[float, float, float, float],
+        columns: Optional[Sequence[str]] = WATERSHED_COLUMNS
+    ) -> gpd.GeoDataFrame:
+        """
+        Read the watershed features in a bbox from a layer opened with ``open_watershed``.
         
-        # Download
-        zip_path = self.download_file(url, "census_data.zip")
+        Parameters
+        ----------
+        bbox : tuple
+            (west, south, east, north) in EPSG:4326
+        columns : sequence of str, optional
+            Attribute columns to read; None reads all columns
+            
+        Returns
+        -------
+        gpd.GeoDataFrame
+            Watershed features in EPSG:4326
+        """
+        if "watershed" not in self._layer_urls:
+            raise RuntimeError("Call open_watershed() before read_watershed_subset()")
+        return self.download_watershed_data(self._layer_urls["watershed"], bbox=bbox, columns=columns)
+    
+    def download_census_data(
+        self,
+        url: str,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        columns: Optional[Sequence[str]] = CENSUS_COLUMNS,
+        lazy: bool = False
+    ) -> Union[gpd.GeoDataFrame, Dict[str, Any]]:
+        """
+        Download and load census data.
         
-        # Extract
-        extract_dir = self.extract_zip(zip_path)
+        Parameters
+        ----------
+        url : str
+            Zenodo URL for census data
+        bbox : tuple, optional
+            (west, south, east, north) in EPSG:4326; only features in this
+            box are read. The subset is returned but not kept as
+            ``self.census_gdf``.
+        columns : sequence of str, optional
+            Attribute columns to read (those missing from the file are
+            ignored); None reads all columns
+        lazy : bool
+            Only open the layer (see ``open_census``) and return its
+            metadata; read features later with ``read_census_subset``
+            
+        Returns
+        -------
+        gpd.GeoDataFrame or dict
+            Census data, or its metadata when ``lazy`` is True
+        """
+        if lazy:
+            return self.open_census(url)
         
-        # Find shapefile
-        shp_files = list(extract_dir.glob("**/*.shp"))
-        if not shp_files:
-            raise FileNotFoundError(f"No shapefile found in {extract_dir}")
+        if self.census_gdf is not None:
+            return _subset_layer(self.census_gdf, bbox, columns)
         
-        shp_path = shp_files[0]
-        print(f"Loading census data from: {shp_path}")
+        # Reuse a layer already parsed by another DataManager
+        columns = None if columns is None else tuple(columns)
+        layer_key = url if columns == CENSUS_COLUMNS else f"{url}|{columns}"
+        # Only full layers are memoized; bbox reads are cut from them
+        cached = _get_cached_layer("census", layer_key)
+        if cached is not None:
+            if bbox is None:
+                self.census_gdf = cached
+            else:
+                cached = _subset_layer(cached, bbox)
+            print(f"✓ Census data already loaded ({len(cached):,} features)")
+            return cached
         
-        self.census_gdf = gpd.read_file(shp_path)
+        # Download
+        zip_path = self.download_file(url, "census_data.zip")
         
-        # CRITICAL FIX: The shapefile has WRONG CRS metadata
-        # The bounds show it's in a projected system (meters), not degrees
-        # Check if bounds are unrealistic for lat/lon
-        bounds = self.census_gdf.total_bounds
+        # Reuse the EPSG:4326 copy written by an earlier run
+        census_gdf = None
+        if columns == CENSUS_COLUMNS:
+            census_gdf = self._read_normalized_layer("census", zip_path, bbox)
+        from_shapefile = census_gdf is None
         
-        if abs(bounds[0]) > 200 or abs(bounds[2]) > 200:
-            # These are projected coordinates, not lat/lon
-            print(f"⚠️  WARNING: Census CRS metadata is incorrect!")
-            print(f"   Bounds: {bounds}")
-            print(f"   CRS says: {self.census_gdf.crs}")
-            print(f"   But these are clearly projected coordinates (meters)")
+        if from_shapefile:
+            # Read the shapefile straight out of the ZIP
+            shp_path = self.zip_shapefile_path(zip_path)
+            print(f"Loading census data from: {shp_path}")
             
-            # Try to identify the actual projection
-            # Most likely this is Albers Equal Area Conic (EPSG:5070) or similar
-            # Let's check the .prj file
-            prj_file = shp_path.with_suffix('.prj')
-            if prj_file.exists():
-                with open(prj_file, 'r') as f:
-                    prj_text = f.read()
-                    print(f"   PRJ file content: {prj_text[:200]}...")
-                    
-                    # Check for common projections
-                    if 'Albers' in prj_text or 'EPSG",5070' in prj_text:
-                        print(f"   Detected: Albers Equal Area Conic (EPSG:5070)")
-                        self.census_gdf = self.census_gdf.set_crs("EPSG:5070", allow_override=True)
-                    elif 'Web_Mercator' in prj_text or 'EPSG",3857' in prj_text:
-                        print(f"   Detected: Web Mercator (EPSG:3857)")
-                        self.census_gdf = self.census_gdf.set_crs("EPSG:3857", allow_override=True)
-                    else:
-                        # Default assumption for US census data
-                        print(f"   Assuming: Albers Equal Area Conic (EPSG:5070)")
-                        self.census_gdf = self.census_gdf.set_crs("EPSG:5070", allow_override=True)
+            assumed_crs = self._assumed_projected_crs(url, shp_path)
+            native_bbox = self._native_bbox(shp_path, bbox, assumed_crs)
+            if native_bbox is not None:
+                census_gdf = _read_vector(shp_path, self.engine, columns, bbox=native_bbox)
             else:
-                # No PRJ file, assume standard US census projection
-                print(f"   Assuming: Albers Equal Area Conic (EPSG:5070)")
-                self.census_gdf = self.census_gdf.set_crs("EPSG:5070", allow_override=True)
+                census_gdf = _read_vector(shp_path, self.engine, columns)
+        
+        # A stored projected CRS is trusted and converted directly
+        stored_crs = census_gdf.crs
+        if not from_shapefile:
+            # Normalized copies are always written in EPSG:4326, so the
+            # checks for wrong shapefile metadata below do not apply
+            if stored_crs is None:
+                census_gdf = census_gdf.set_crs(WGS84)
+        elif stored_crs is not None and not stored_crs.is_geographic:
+            print(f"Converting census from {stored_crs} to EPSG:4326")
+            census_gdf = _to_crs_cached(census_gdf, WGS84)
+        else:
+            # CRITICAL FIX: The shapefile may have WRONG CRS metadata
+            # (degrees declared, but projected coordinates in meters).
+            # A sample of the bounds is enough to tell the two apart.
+            bounds = _sample_bounds(census_gdf)
             
-            # Now convert to WGS84
-            print(f"   Converting to EPSG:4326...")
-            self.census_gdf = self.census_gdf.to_crs("EPSG:4326")
+            if abs(bounds[0]) > 200 or abs(bounds[2]) > 200:
+                # These are projected coordinates, not lat/lon
+                print(f"⚠️  WARNING: Census CRS metadata is incorrect!")
+                print(f"   Bounds: {bounds}")
+                print(f"   CRS says: {census_gdf.crs}")
+                print(f"   But these are clearly projected coordinates (meters)")
+                
+                # Identify the actual projection (known dataset or .prj file;
+                # most likely Albers Equal Area Conic, EPSG:5070)
+                actual_crs = assumed_crs
+                if actual_crs is WEB_MERCATOR:
+                    print(f"   Detected: Web Mercator (EPSG:3857)")
+                else:
+                    print(f"   Assuming: Albers Equal Area Conic (EPSG:5070)")
+                census_gdf = census_gdf.set_crs(actual_crs, allow_override=True)
+                
+                # Now convert to WGS84
+                print(f"   Converting to EPSG:4326...")
+                census_gdf = _to_crs_cached(census_gdf, WGS84)
+                
+                # Verify conversion (the sample used for the check suffices)
+                new_bounds = _sample_bounds(census_gdf)
+                print(f"   New bounds: {new_bounds}")
+                print(f"   ✓ Conversion successful!")
             
-            # Verify conversion
-            new_bounds = self.census_gdf.total_bounds
-            print(f"   New bounds: {new_bounds}")
-            print(f"   ✓ Conversion successful!")
+            else:
+                # Bounds look reasonable for lat/lon, ensure it's set correctly
+                if census_gdf.crs is None:
+                    print("Setting CRS to EPSG:4326")
+                    census_gdf = census_gdf.set_crs(WGS84)
+                elif census_gdf.crs.to_string() != "EPSG:4326":
+                    print(f"Converting census from {census_gdf.crs} to EPSG:4326")
+                    census_gdf = _to_crs_cached(census_gdf, WGS84)
         
+        if bbox is None:
+            self.census_gdf = census_gdf
+            _set_cached_layer("census", layer_key, census_gdf)
+            if from_shapefile and columns == CENSUS_COLUMNS:
+                self._write_normalized_layer("census", census_gdf)
         else:
-            # Bounds look reasonable for lat/lon, ensure it's set correctly
-            if self.census_gdf.crs is None:
-                print("Setting CRS to EPSG:4326")
-                self.census_gdf = self.census_gdf.set_crs("EPSG:4326")
-            elif self.census_gdf.crs.to_string() != "EPSG:4326":
-                print(f"Converting census from {self.census_gdf.crs} to EPSG:4326")
-                self.census_gdf = self.census_gdf.to_crs("EPSG:4326")
+            # Exact lon/lat filter (also covers reads without a pushed-down bbox)
+            census_gdf = census_gdf.cx[bbox[0]:bbox[2], bbox[1]:bbox[3]]
         
-        print(f"✓ Loaded {len(self.census_gdf):,} census features (EPSG:4326)")
-        print(f"  Final bounds: {self.census_gdf.total_bounds}")
+        print(f"✓ Loaded {len(census_gdf):,} census features (EPSG:4326)")
+        print(f"  Final bounds: {census_gdf.total_bounds}")
         
-        return self.census_gdf
+        return census_gdf
     
-    def download_watershed_data(self, url: str) -> gpd.GeoDataFrame:
+    def download_watershed_data(
+        self,
+        url: str,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        columns: Optional[Sequence[str]] = WATERSHED_COLUMNS,
+        lazy: bool = False
+    ) -> Union[gpd.GeoDataFrame, Dict[str, Any]]:
         """
         Download and load watershed data.
         
@@ -206,56 +1032,110 @@ class DataManager:
         ----------
         url : str
             Zenodo URL for watershed data
+        bbox : tuple, optional
+            (west, south, east, north) in EPSG:4326; only features in this
+            box are read. The subset is returned but not kept as
+            ``self.watershed_gdf``.
+        columns : sequence of str, optional
+            Attribute columns to read (those missing from the file are
+            ignored); None reads all columns
+        lazy : bool
+            Only open the layer (see ``open_watershed``) and return its
+            metadata; read features later with ``read_watershed_subset``
             
         Returns
         -------
-        gpd.GeoDataFrame
-            Watershed data
+        gpd.GeoDataFrame or dict
+            Watershed data, or its metadata when ``lazy`` is True
         """
+        if lazy:
+            return self.open_watershed(url)
+        
         if self.watershed_gdf is not None:
-            return self.watershed_gdf
+            return _subset_layer(self.watershed_gdf, bbox, columns)
+        
+        # Reuse a layer already parsed by another DataManager
+        columns = None if columns is None else tuple(columns)
+        layer_key = url if columns == WATERSHED_COLUMNS else f"{url}|{columns}"
+        # Only full layers are memoized; bbox reads are cut from them
+        cached = _get_cached_layer("watershed", layer_key)
+        if cached is not None:
+            if bbox is None:
+                self.watershed_gdf = cached
+            else:
+                cached = _subset_layer(cached, bbox)
+            print(f"✓ Watershed data already loaded ({len(cached):,} features)")
+            return cached
         
         # Download
         zip_path = self.download_file(url, "watershed_data.zip")
         
-        # Extract
-        extract_dir = self.extract_zip(zip_path)
-        
-        # Find shapefile
-        shp_files = list(extract_dir.glob("**/*.shp"))
-        if not shp_files:
-            raise FileNotFoundError(f"No shapefile found in {extract_dir}")
-        
-        shp_path = shp_files[0]
-        print(f"Loading watershed data from: {shp_path}")
+        # Reuse the EPSG:4326 copy written by an earlier run
+        watershed_gdf = None
+        if columns == WATERSHED_COLUMNS:
+            watershed_gdf = self._read_normalized_layer("watershed", zip_path, bbox)
+        from_shapefile = watershed_gdf is None
         
-        self.watershed_gdf = gpd.read_file(shp_path)
+        if from_shapefile:
+            # Read the shapefile straight out of the ZIP
+            shp_path = self.zip_shapefile_path(zip_path)
+            print(f"Loading watershed data from: {shp_path}")
+            
+            native_bbox = self._native_bbox(shp_path, bbox, ALBERS_CONUS)
+            if native_bbox is not None:
+                watershed_gdf = _read_vector(shp_path, self.engine, columns, bbox=native_bbox)
+            else:
+                watershed_gdf = _read_vector(shp_path, self.engine, columns)
         
         # Check and fix CRS similar to census
-        bounds = self.watershed_gdf.total_bounds
-        
-        if abs(bounds[0]) > 200 or abs(bounds[2]) > 200:
-            # Projected coordinates
-            print(f"⚠️  WARNING: Watershed CRS metadata is incorrect!")
-            print(f"   Assuming: Albers Equal Area Conic (EPSG:5070)")
-            self.watershed_gdf = self.watershed_gdf.set_crs("EPSG:5070", allow_override=True)
-            print(f"   Converting to EPSG:4326...")
-            self.watershed_gdf = self.watershed_gdf.to_crs("EPSG:4326")
-            print(f"   ✓ Conversion successful!")
+        stored_crs = watershed_gdf.crs
+        if not from_shapefile:
+            # Normalized copies are always written in EPSG:4326, so the
+            # checks for wrong shapefile metadata below do not apply
+            if stored_crs is None:
+                watershed_gdf = watershed_gdf.set_crs(WGS84)
+        elif stored_crs is not None and not stored_crs.is_geographic:
+            print(f"Converting watershed from {stored_crs} to EPSG:4326")
+            watershed_gdf = _to_crs_cached(watershed_gdf, WGS84)
         else:
-            # Ensure WGS84
-            if self.watershed_gdf.crs is None:
-                self.watershed_gdf = self.watershed_gdf.set_crs("EPSG:4326")
-            elif self.watershed_gdf.crs.to_string() != "EPSG:4326":
-                print(f"Converting watershed from {self.watershed_gdf.crs} to EPSG:4326")
-                self.watershed_gdf = self.watershed_gdf.to_crs("EPSG:4326")
+            bounds = _sample_bounds(watershed_gdf)
+            
+            if abs(bounds[0]) > 200 or abs(bounds[2]) > 200:
+                # Projected coordinates
+                print(f"⚠️  WARNING: Watershed CRS metadata is incorrect!")
+                print(f"   Assuming: Albers Equal Area Conic (EPSG:5070)")
+                watershed_gdf = watershed_gdf.set_crs(ALBERS_CONUS, allow_override=True)
+                print(f"   Converting to EPSG:4326...")
+                watershed_gdf = _to_crs_cached(watershed_gdf, WGS84)
+                print(f"   ✓ Conversion successful!")
+            else:
+                # Ensure WGS84
+                if watershed_gdf.crs is None:
+                    watershed_gdf = watershed_gdf.set_crs(WGS84)
+                elif watershed_gdf.crs.to_string() != "EPSG:4326":
+                    print(f"Converting watershed from {watershed_gdf.crs} to EPSG:4326")
+                    watershed_gdf = _to_crs_cached(watershed_gdf, WGS84)
+        
+        if bbox is None:
+            self.watershed_gdf = watershed_gdf
+            _set_cached_layer("watershed", layer_key, watershed_gdf)
+            if from_shapefile and columns == WATERSHED_COLUMNS:
+                self._write_normalized_layer("watershed", watershed_gdf)
+        else:
+            # Exact lon/lat filter (also covers reads without a pushed-down bbox)
+            watershed_gdf = watershed_gdf.cx[bbox[0]:bbox[2], bbox[1]:bbox[3]]
         
-        print(f"✓ Loaded {len(self.watershed_gdf):,} watershed features (EPSG:4326)")
-        print(f"  Final bounds: {self.watershed_gdf.total_bounds}")
+        print(f"✓ Loaded {len(watershed_gdf):,} watershed features (EPSG:4326)")
+        print(f"  Final bounds: {watershed_gdf.total_bounds}")
         
-        return self.watershed_gdf
+        return watershed_gdf
     
-    def load_custom_layer(self, name: str, filepath: str) -> gpd.GeoDataFrame:
+    def load_custom_layer(
+        self,
+        name: str,
+        filepath: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> gpd.GeoDataFrame:
         """
         Load a custom enhanced layer.
         
@@ -265,6 +1145,8 @@ class DataManager:
             Name for the layer
         filepath : str
             Path to shapefile or GeoJSON
+        columns : sequence of str, optional
+            Attribute columns to read; None (default) reads all columns
             
         Returns
         -------
@@ -274,8 +1156,15 @@ class DataManager:
         if name in self.custom_layers:
             return self.custom_layers[name]
         
+        cache_key = filepath if columns is None else f"{filepath}|{tuple(columns)}"
+        gdf = _get_cached_layer("custom", cache_key)
+        if gdf is not None:
+            self.custom_layers[name] = gdf
+            return gdf
+        
         print(f"Loading custom layer '{name}' from: {filepath}")
-        gdf = gpd.read_file(filepath)
+        gdf = _read_vector(filepath, self.engine, columns)
+        _set_cached_layer("custom", cache_key, gdf)
         self.custom_layers[name] = gdf
         print(f"✓ Loaded {len(gdf):,} features for layer '{name}'")
         
@@ -287,7 +1176,8 @@ class DataManager:
         use_watershed: bool = True,
         census_url: Optional[str] = None,
         watershed_url: Optional[str] = None,
-        custom_layers: Optional[Dict[str, str]] = None
+        custom_layers: Optional[Dict[str, str]] = None,
+        aoi_bounds: Optional[Tuple[float, float, float, float]] = None
     ) -> Tuple[Optional[gpd.GeoDataFrame], Optional[gpd.GeoDataFrame], Dict[str, gpd.GeoDataFrame]]:
         """
         Get all requested enhanced layers.
@@ -304,6 +1194,9 @@ class DataManager:
             Zenodo URL for watershed
         custom_layers : dict, optional
             Custom layers {name: filepath}
+        aoi_bounds : tuple, optional
+            (west, south, east, north) in EPSG:4326; census and watershed
+            features outside it are skipped at read time
             
         Returns
         -------
@@ -313,21 +1206,37 @@ class DataManager:
         census_gdf = None
         watershed_gdf = None
         custom_dict = {}
+        custom_layers = custom_layers or {}
         
-        if use_census and census_url:
-            census_gdf = self.download_census_data(census_url)
-        
-        if use_watershed and watershed_url:
-            watershed_gdf = self.download_watershed_data(watershed_url)
-        
-        if custom_layers:
-            for name, filepath in custom_layers.items():
-                custom_dict[name] = self.load_custom_layer(name, filepath)
+        # Layers are independent and mostly network/disk bound (pyogrio
+        # releases the GIL): load concurrently, with a bounded thread count
+        # so many small custom layers queue up instead of oversubscribing
+        with ThreadPoolExecutor(max_workers=min(MAX_LAYER_WORKERS, 2 + len(custom_layers))) as executor:
+            fut_census = (
+                executor.submit(self.download_census_data, census_url, bbox=aoi_bounds)
+                if use_census and census_url else None
+            )
+            fut_watershed = (
+                executor.submit(self.download_watershed_data, watershed_url, bbox=aoi_bounds)
+                if use_watershed and watershed_url else None
+            )
+            fut_custom = {
+                name: executor.submit(self.load_custom_layer, name, filepath)
+                for name, filepath in custom_layers.items()
+            }
+            
+            if fut_census is not None:
+                census_gdf = fut_census.result()
+            if fut_watershed is not None:
+                watershed_gdf = fut_watershed.result()
+            for name, future in fut_custom.items():
+                custom_dict[name] = future.result()
         
         return census_gdf, watershed_gdf, custom_dict
     
     def clip_to_land(self, gdf: gpd.GeoDataFrame, 
-                     land_boundary: Optional[gpd.GeoDataFrame] = None) -> gpd.GeoDataFrame:
+                     land_boundary: Optional[gpd.GeoDataFrame] = None,
+                     census_url: Optional[str] = None) -> gpd.GeoDataFrame:
         """
         Clip GeoDataFrame to land areas.
         
@@ -337,6 +1246,9 @@ class DataManager:
             GeoDataFrame to clip
         land_boundary : gpd.GeoDataFrame, optional
             Boundary to use (defaults to census boundary)
+        census_url : str, optional
+            Census source used when no boundary is loaded yet; only the
+            census features under ``gdf`` are read
             
         Returns
         -------
@@ -344,14 +1256,18 @@ class DataManager:
             Clipped GeoDataFrame
         """
         if land_boundary is None:
-            if self.census_gdf is None:
+            if self.census_gdf is not None:
+                land_boundary = self.census_gdf
+            elif census_url is not None and not gdf.empty:
+                aoi_bounds = tuple(_to_crs_cached(gdf, WGS84).total_bounds)
+                land_boundary = self.download_census_data(census_url, bbox=aoi_bounds)
+            else:
                 print("Warning: No land boundary available for clipping")
                 return gdf
-            land_boundary = self.census_gdf
         
         # Ensure same CRS
         if gdf.crs != land_boundary.crs:
-            gdf = gdf.to_crs(land_boundary.crs)
+            gdf = _to_crs_cached(gdf, land_boundary.crs)
         
         # OPTIMIZATION: Use spatial index instead of full union
         print("Clipping to land using spatial index...")
@@ -359,23 +1275,23 @@ class DataManager:
         # Get bounding box of all AOIs
         bounds = gdf.total_bounds
         
-        # Pre-filter census data to only relevant area
-        land_subset = land_boundary.cx[bounds[0]:bounds[2], bounds[1]:bounds[3]]
+        # Count census features in the relevant area; the layer's STRtree is
+        # built once and reused by every later clip
+        idx = land_boundary.sindex.query(shapely.box(*bounds), predicate="intersects")
         
-        if len(land_subset) == 0:
+        if len(idx) == 0:
             print("Warning: No land features in AOI area")
             return gpd.GeoDataFrame(columns=gdf.columns, crs=gdf.crs)
         
-        print(f"Using {len(land_subset):,} land features (filtered from {len(land_boundary):,})")
-        
-        # Use spatial join instead of union (much faster)
-        clipped = gpd.sjoin(gdf, land_subset, how='inner', predicate='intersects')
-        
-        # Remove duplicate columns from spatial join
-        clipped = clipped[gdf.columns]
+        print(f"Using {len(idx):,} land features (filtered from {len(land_boundary):,})")
         
-        # Remove duplicates (one AOI might intersect multiple census blocks)
-        clipped = clipped.drop_duplicates(subset=['id'] if 'id' in clipped.columns else None)
+        # Query the full layer's tree rather than a subset, which would build
+        # a fresh STRtree on every clip; an AOI that hits several census
+        # blocks just sets its keep flag more than once
+        aoi_pos, _ = land_boundary.sindex.query(gdf.geometry.values, predicate='intersects')
+        keep = np.zeros(len(gdf), dtype=bool)
+        keep[aoi_pos] = True
+        clipped = gdf.loc[keep]
         
         print(f"✓ Retained {len(clipped)}/{len(gdf)} features over land")
         
@@ -413,15 +1329,19 @@ def download_enhanced_layers(
     if watershed_url is None:
         watershed_url = "https://zenodo.org/records/18497756/files/National_Huc_12_preprocessed.zip"
     
-    census_gdf = manager.download_census_data(census_url)
-    watershed_gdf = manager.download_watershed_data(watershed_url)
+    census_gdf, watershed_gdf, _ = manager.get_enhanced_layers(
+        census_url=census_url,
+        watershed_url=watershed_url
+    )
     
     return census_gdf, watershed_gdf
 
 
 def load_enhanced_layers(
     census_path: str,
-    watershed_path: str
+    watershed_path: str,
+    census_columns: Optional[Sequence[str]] = CENSUS_COLUMNS,
+    watershed_columns: Optional[Sequence[str]] = WATERSHED_COLUMNS
 ) -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
     """
     Load enhanced layers from local files.
@@ -432,18 +1352,29 @@ def load_enhanced_layers(
         Path to census shapefile
     watershed_path : str
         Path to watershed shapefile
+    census_columns, watershed_columns : sequence of str, optional
+        Attribute columns to read (missing names are ignored); None reads
+        all columns
         
     Returns
     -------
     tuple
         (census_gdf, watershed_gdf)
     """
-    print(f"Loading census from: {census_path}")
-    census_gdf = gpd.read_file(census_path)
+    census_key = f"{census_path}|{census_columns}"
+    census_gdf = _get_cached_layer("file", census_key)
+    if census_gdf is None:
+        print(f"Loading census from: {census_path}")
+        census_gdf = _read_vector(census_path, columns=census_columns)
+        _set_cached_layer("file", census_key, census_gdf)
     print(f"✓ Loaded {len(census_gdf):,} census features")
     
-    print(f"Loading watershed from: {watershed_path}")
-    watershed_gdf = gpd.read_file(watershed_path)
+    watershed_key = f"{watershed_path}|{watershed_columns}"
+    watershed_gdf = _get_cached_layer("file", watershed_key)
+    if watershed_gdf is None:
+        print(f"Loading watershed from: {watershed_path}")
+        watershed_gdf = _read_vector(watershed_path, columns=watershed_columns)
+        _set_cached_layer("file", watershed_key, watershed_gdf)
     print(f"✓ Loaded {len(watershed_gdf):,} watershed features")
     
     return census_gdf, watershed_gdf
\ No newline at end of file
@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -17,9 +18,122 @@ import geopandas as gpd
 import rasterio
 from rasterio.transform import from_origin
 from rasterio.features import rasterize
+import shapely
+from rasterio.windows import (
+    Window,
+    from_bounds as window_from_bounds,
+    transform as window_transform
+)
 from rasterio.crs import CRS
 
 from .config import ForecastConfig
+from .data_manager import WGS84, _to_crs_cached, read_aoi_bounds, read_aoi_file
+
+# Optional dependencies
+try:
+    from rusterize import rusterize
+    RUSTERIZE_AVAILABLE = True
+except ImportError:
+    RUSTERIZE_AVAILABLE = False
+
+
+def _ensure_wgs84(gdf: gpd.GeoDataFrame, label: Optional[str] = None) -> gpd.GeoDataFrame:
+    """
+    Return ``gdf`` in EPSG:4326, reprojecting only when it is not already.
+    
+    A missing CRS is assumed to be EPSG:4326. With ``label`` set, the
+    assumption or conversion is reported.
+    """
+    if gdf.crs is None:
+        if label:
+            print(f"WARNING: {label} data has no CRS, assuming EPSG:4326")
+        return gdf.set_crs(WGS84)
+    
+    if gdf.crs.to_epsg() != 4326:
+        if label:
+            print(f"Converting {label} from {gdf.crs.to_string()} to EPSG:4326")
+        return _to_crs_cached(gdf, WGS84)
+    
+    return gdf
+
+
+def _burn_mask(
+    geoms: np.ndarray,
+    out_shape: Tuple[int, int],
+    transform: rasterio.Affine,
+    all_touched: bool = False
+) -> np.ndarray:
+    """
+    Rasterize geometries into a 0/1 uint8 mask on a north-up grid.
+    
+    Uses rusterize's compiled scanline fill when installed (same
+    pixel-center rule as GDAL), otherwise ``rasterio.features.rasterize``.
+    
+    Parameters
+    ----------
+    geoms : np.ndarray
+        Shapely geometries
+    out_shape : tuple
+        (rows, cols) of the output
+    transform : Affine
+        Grid transform
+    all_touched : bool
+        Burn every pixel touched by a geometry
+        
+    Returns
+    -------
+    np.ndarray
+        uint8 mask
+    """
+    if RUSTERIZE_AVAILABLE:
+        rows, cols = out_shape
+        extent = (
+            transform.c, transform.f + rows * transform.e,
+            transform.c + cols * transform.a, transform.f
+        )
+        return rusterize(
+            geoms, out_shape=out_shape, extent=extent, burn=1, fun="any",
+            background=0, all_touched=all_touched, encoding="numpy", dtype="uint8"
+        )[0]
+    
+    return rasterize(
+        shapes=((geom, 1) for geom in geoms),
+        out_shape=out_shape,
+        transform=transform,
+        fill=0,
+        default_value=1,
+        all_touched=all_touched,
+        dtype=np.uint8
+    )
+
+
+def _spans_pixel_center(bounds: np.ndarray, transform: rasterio.Affine) -> np.ndarray:
+    """
+    Flag geometries whose bounding box contains at least one pixel center.
+    
+    Without ``all_touched`` a pixel burns only when its center falls inside
+    the geometry, so geometries failing this test can never burn anything
+    and need not be rasterized. The test is padded slightly to stay
+    conservative against floating-point error.
+    
+    Parameters
+    ----------
+    bounds : np.ndarray
+        ``(n, 4)`` array of (minx, miny, maxx, maxy), e.g. ``shapely.bounds``
+    transform : Affine
+        North-up grid transform
+        
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, one entry per geometry
+    """
+    eps = 1e-9
+    col_lo = np.ceil((bounds[:, 0] - transform.c) / transform.a - 0.5 - eps)
+    col_hi = np.floor((bounds[:, 2] - transform.c) / transform.a - 0.5 + eps)
+    row_lo = np.ceil((bounds[:, 3] - transform.f) / transform.e - 0.5 - eps)
+    row_hi = np.floor((bounds[:, 1] - transform.f) / transform.e - 0.5 + eps)
+    return (col_hi >= col_lo) & (row_hi >= row_lo)
 
 
 class EnsembleProcessor:
@@ -39,7 +153,9 @@ class EnsembleProcessor:
         bins: Optional[List[Tuple[float, float]]] = None,
         bin_labels: Optional[List[str]] = None,
         resolution_deg: float = 0.05,
-        crs: str = "EPSG:4326"
+        crs: str = "EPSG:4326",
+        tile_size: int = 512,
+        n_workers: Optional[int] = None
     ):
         """
         Initialize EnsembleProcessor.
@@ -56,10 +172,17 @@ class EnsembleProcessor:
             Grid resolution in degrees
         crs : str
             Coordinate reference system
+        tile_size : int
+            Edge length (pixels) of the tiles rasterized in parallel
+        n_workers : int, optional
+            Threads used to read members and rasterize tiles (defaults to
+            CPU count)
         """
         self.root_dir = Path(root_dir)
         self.resolution_deg = resolution_deg
         self.crs = CRS.from_string(crs)
+        self.tile_size = tile_size
+        self.n_workers = n_workers
         
         # Threshold bins
         if bins is None:
@@ -72,6 +195,10 @@ class EnsembleProcessor:
         else:
             self.bin_labels = bin_labels
         
+        # Inclusive bin edges for vectorized lookups
+        self._bin_lo = np.array([lo for lo, _ in self.bins], dtype=np.float64)
+        self._bin_hi = np.array([hi for _, hi in self.bins], dtype=np.float64)
+        
         # Output directory
         self.out_dir = self.root_dir / "ensemble_probability"
         self.out_dir.mkdir(exist_ok=True)
@@ -79,6 +206,8 @@ class EnsembleProcessor:
         # Storage
         self.members: List[Dict] = []
         self.prob_paths: Dict[str, Path] = {}
+        self._prob_arrays: Dict[str, Tuple[np.ndarray, rasterio.Affine]] = {}
+        self._census_layer: Optional[Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]] = None
     
     def threshold_to_bin_label(self, threshold: float) -> str:
         """
@@ -94,10 +223,53 @@ class EnsembleProcessor:
         str
             Bin label
         """
-        for (lo, hi), label in zip(self.bins, self.bin_labels):
-            if lo <= threshold <= hi:
-                return label
-        return "UNBINNED"
+        b = int(self.threshold_bin_indices([threshold])[0])
+        return self.bin_labels[b] if b >= 0 else "UNBINNED"
+    
+    def threshold_bin_indices(self, thresholds) -> np.ndarray:
+        """
+        Map many threshold values to bin indices at once.
+        
+        Bins are inclusive at both ends and the first matching bin wins,
+        so gaps and shared edges behave as in ``threshold_to_bin_label``.
+        
+        Parameters
+        ----------
+        thresholds : array-like
+            Threshold values
+            
+        Returns
+        -------
+        np.ndarray
+            Bin index per threshold, -1 where no bin matches
+        """
+        thr = np.asarray(thresholds, dtype=np.float64).reshape(-1, 1)
+        in_bin = (self._bin_lo <= thr) & (thr <= self._bin_hi)
+        return np.where(in_bin.any(axis=1), in_bin.argmax(axis=1), -1)
+    
+    def _tile_grid(self, tile_size: int = 512) -> np.ndarray:
+        """
+        Split the ensemble grid into non-overlapping tiles.
+        
+        Parameters
+        ----------
+        tile_size : int
+            Tile edge length in pixels
+            
+        Returns
+        -------
+        np.ndarray
+            Array of ``[row_start, row_end, col_start, col_end]`` per tile
+        """
+        row_starts = np.arange(0, self.height, tile_size)
+        col_starts = np.arange(0, self.width, tile_size)
+        
+        tiles = [
+            [r0, min(r0 + tile_size, self.height), c0, min(c0 + tile_size, self.width)]
+            for r0 in row_starts
+            for c0 in col_starts
+        ]
+        return np.array(tiles, dtype=np.int64).reshape(-1, 4)
     
     def collect_members(self) -> List[Dict]:
         """
@@ -112,7 +284,7 @@ class EnsembleProcessor:
         print("COLLECTING ENSEMBLE MEMBERS")
         print("="*70)
         
-        pattern = re.compile(r"F(?P<fxx>\d+)_T(?P<thr>\d+)_aois\.geojson$")
+        pattern = re.compile(r"F(?P<fxx>\d+)_T(?P<thr>\d+)_aois\.(geojsonl?|parquet)$")
         members = []
         all_bounds = []
         
@@ -126,9 +298,6 @@ class EnsembleProcessor:
                     continue
                 
                 for file in date_dir.iterdir():
-                    if not file.suffix == ".geojson":
-                        continue
-                    
                     m = pattern.search(file.name)
                     if not m:
                         continue
@@ -136,12 +305,11 @@ class EnsembleProcessor:
                     fxx = int(m.group("fxx"))
                     thr = int(m.group("thr"))
                     
-                    # Peek bounds
+                    # Peek bounds (file metadata only, no geometries)
                     try:
-                        gdf = gpd.read_file(file)
-                        if not gdf.empty:
-                            gdf = gdf.to_crs(epsg=4326)
-                            all_bounds.append(gdf.total_bounds.tolist())
+                        bounds = read_aoi_bounds(file)
+                        if bounds is not None:
+                            all_bounds.append(list(bounds))
                     except Exception as e:
                         warnings.warn(f"Failed to read {file}: {e}")
                         continue
@@ -192,6 +360,28 @@ class EnsembleProcessor:
         
         return members
     
+    def _member_gdf(self, mem: Dict) -> gpd.GeoDataFrame:
+        """
+        A member's AOIs in EPSG:4326, read once and kept on the member.
+        
+        Parameters
+        ----------
+        mem : dict
+            Member from ``collect_members``
+            
+        Returns
+        -------
+        gpd.GeoDataFrame
+            Member AOIs
+        """
+        gdf = mem.get("_gdf")
+        if gdf is None:
+            gdf = read_aoi_file(mem["path"])
+            if not gdf.empty:
+                gdf = _ensure_wgs84(gdf)
+            mem["_gdf"] = gdf
+        return gdf
+    
     def create_ensemble_probabilities(self) -> Dict[str, Path]:
         """
         Create ensemble probability GeoTIFFs for each bin.
@@ -208,60 +398,87 @@ class EnsembleProcessor:
         print("CREATING ENSEMBLE PROBABILITIES")
         print("="*70)
         
-        # Initialize accumulators
-        counts_by_bin = {
-            lbl: np.zeros((self.height, self.width), dtype=np.uint16)
-            for lbl in self.bin_labels
-        }
-        denom_by_bin = {lbl: 0 for lbl in self.bin_labels}
+        n_bins = len(self.bin_labels)
         
-        # Rasterize each member
-        for mem in self.members:
-            lbl = self.threshold_to_bin_label(mem["thr"])
-            denom_by_bin[lbl] += 1
-            
+        # Bin every member first: empty members still count in the denominators
+        member_bins = self.threshold_bin_indices([mem["thr"] for mem in self.members])
+        for b, mem in zip(member_bins, self.members):
+            if b < 0:
+                warnings.warn(f"Threshold {mem['thr']} is outside all bins; skipping {mem['path']}")
+        member_jobs = [(int(b), mem) for b, mem in zip(member_bins, self.members) if b >= 0]
+        member_bins = member_bins[member_bins >= 0]
+        
+        def load_member(job):
+            b, mem = job
             try:
-                gdf = gpd.read_file(mem["path"])
+                gdf = self._member_gdf(mem)
                 if gdf.empty:
-                    continue
+                    return None
                 
-                # Ensure WGS84
-                gdf = gdf.to_crs(epsg=4326)
+                geoms = np.asarray(gdf.geometry.values)
+                geoms = geoms[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
                 
-                # Rasterize
-                shapes = [(geom, 1) for geom in gdf.geometry if geom and not geom.is_empty]
-                if not shapes:
-                    continue
+                # Sub-pixel AOIs that miss every pixel center burn nothing
+                geoms = geoms[_spans_pixel_center(shapely.bounds(geoms), self.transform)]
+                if len(geoms) == 0:
+                    return None
                 
-                tmp = rasterize(
-                    shapes=shapes,
-                    out_shape=(self.height, self.width),
-                    transform=self.transform,
-                    fill=0,
-                    default_value=1,
-                    dtype=np.uint8
+                # Pixel window (col_a, row_a, col_b, row_b) of the member's
+                # footprint on the ensemble grid
+                minx, miny, maxx, maxy = shapely.total_bounds(geoms)
+                t = self.transform
+                return b, geoms, (
+                    int(np.floor((minx - t.c) / t.a)), int(np.floor((maxy - t.f) / t.e)),
+                    int(np.ceil((maxx - t.c) / t.a)), int(np.ceil((miny - t.f) / t.e))
                 )
                 
-                counts_by_bin[lbl] += tmp.astype(np.uint16)
-                
             except Exception as e:
                 warnings.warn(f"Failed to process member {mem['path']}: {e}")
-                continue
+                return None
         
-        # Compute probabilities and save
-        for lbl in self.bin_labels:
-            denom = denom_by_bin[lbl]
+        # Members per bin; the largest bin decides the count dtype
+        denominators = np.bincount(np.asarray(member_bins, dtype=np.intp), minlength=n_bins)
+        denom_by_bin = {lbl: int(d) for lbl, d in zip(self.bin_labels, denominators)}
+        count_dtype = np.uint8 if denominators.max(initial=0) <= np.iinfo(np.uint8).max else np.uint16
+        
+        # Initialize accumulators: one (bins, rows, cols) count stack
+        counts = np.zeros((n_bins, self.height, self.width), dtype=count_dtype)
+        
+        def rasterize_tile(tile):
+            r0, r1, c0, c1 = (int(v) for v in tile)
             
-            if denom == 0:
-                print(f"[WARN] No members for bin {lbl}")
-                continue
+            for b, geoms, (col_a, row_a, col_b, row_b) in member_shapes:
+                # Burn only where the member's pixel footprint meets this tile
+                mc0, mc1 = max(c0, col_a), min(c1, col_b)
+                mr0, mr1 = max(r0, row_a), min(r1, row_b)
+                if mc0 >= mc1 or mr0 >= mr1:
+                    continue
+                
+                window = Window(mc0, mr0, mc1 - mc0, mr1 - mr0)
+                tmp = _burn_mask(geoms, (mr1 - mr0, mc1 - mc0), window_transform(window, self.transform))
+                
+                # Tiles never overlap, so workers write disjoint slices
+                np.add(counts[b, mr0:mr1, mc0:mc1], tmp, out=counts[b, mr0:mr1, mc0:mc1], casting="unsafe")
+        
+        # One pool for both stages: members are read concurrently (pyogrio
+        # releases the GIL while parsing), then tiles rasterize in parallel
+        tiles = self._tile_grid(self.tile_size)
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            member_shapes = [m for m in executor.map(load_member, member_jobs) if m is not None]
+            list(executor.map(rasterize_tile, tiles))
+        
+        print(f"Rasterized {len(member_shapes)} non-empty members over {len(tiles)} tiles")
+        
+        def write_bin(b):
+            lbl = self.bin_labels[b]
             
-            # Calculate probability
-            prob = counts_by_bin[lbl].astype(np.float32) / float(denom)
-            prob = np.clip(prob, 0.0, 1.0)
+            # Counts never exceed the bin's member total, so a single float32
+            # divide already lands in [0, 1]: no zero-fill or clip pass
+            prob = np.divide(counts[b], np.float32(denominators[b]), dtype=np.float32)
             
             # Save GeoTIFF
             tif_path = self.out_dir / f"probability_{lbl.replace('+', 'plus')}.tif"
+            note = None
             
             # Delete existing file if it exists
             if tif_path.exists():
@@ -271,28 +488,55 @@ class EnsembleProcessor:
                     import time
                     timestamp = int(time.time())
                     tif_path = self.out_dir / f"probability_{lbl.replace('+', 'plus')}_{timestamp}.tif"
-                    print(f"  File locked, using: {tif_path.name}")
+                    note = f"  File locked, using: {tif_path.name}"
             
             profile = {
-                "driver": "GTiff",
+                # Cloud Optimized GeoTIFF: tiled, with averaged overviews, so
+                # readers fetch only the blocks and zoom level they need
+                "driver": "COG",
                 "height": prob.shape[0],
                 "width": prob.shape[1],
                 "count": 1,
                 "dtype": "float32",
                 "crs": self.crs,
                 "transform": self.transform,
-                "compress": "lzw"
+                "blocksize": 512,
+                "overview_resampling": "average",
+                "compress": "zstd",
+                "predictor": 3,  # Floating-point predictor
+                # Compress blocks on every core; output bytes are unchanged
+                "num_threads": "ALL_CPUS",
+                "BIGTIFF": "IF_SAFER"
             }
             
             try:
                 with rasterio.open(tif_path, "w", **profile) as dst:
                     dst.write(prob, 1)
-                
-                self.prob_paths[lbl] = tif_path
-                print(f"✓ {lbl:10s}: {tif_path}")
             except PermissionError:
+                return lbl, note, None, prob
+            
+            return lbl, note, tif_path, prob
+        
+        # Bins are independent files; GDAL releases the GIL while encoding,
+        # so they are written concurrently and reported in bin order
+        for b, lbl in enumerate(self.bin_labels):
+            if denominators[b] == 0:
+                print(f"[WARN] No members for bin {lbl}")
+        
+        to_write = np.flatnonzero(denominators).tolist()
+        with ThreadPoolExecutor(max_workers=max(1, len(to_write))) as executor:
+            written = list(executor.map(write_bin, to_write))
+        
+        for lbl, note, tif_path, prob in written:
+            if note:
+                print(note)
+            if tif_path is None:
                 print(f"✗ {lbl:10s}: Permission denied (file may be open)")
                 continue
+            
+            self.prob_paths[lbl] = tif_path
+            self._prob_arrays[lbl] = (prob, self.transform)
+            print(f"✓ {lbl:10s}: {tif_path}")
         
         # Save manifest
         self.save_manifest(denom_by_bin)
@@ -326,12 +570,338 @@ class EnsembleProcessor:
             "probability_tifs": {k: str(v) for k, v in self.prob_paths.items()}
         }
         
+        # Write beside the target and rename, so a crash never leaves a
+        # truncated manifest behind
         manifest_path = self.out_dir / "ensemble_manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+        part_path = manifest_path.with_name(manifest_path.name + ".part")
+        try:
+            with open(part_path, "w") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(part_path, manifest_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
         
         print(f"✓ Manifest: {manifest_path}")
     
+    def _read_probability(
+        self,
+        lbl: str,
+        bounds: Tuple[float, float, float, float]
+    ) -> Optional[Tuple[np.ndarray, rasterio.Affine]]:
+        """
+        Get the part of a bin's probability raster covering ``bounds``.
+        
+        Arrays created in this session are used directly; otherwise only the
+        tiles of the GeoTIFF under ``bounds`` are read from disk.
+        
+        Parameters
+        ----------
+        lbl : str
+            Bin label
+        bounds : tuple
+            (west, south, east, north) in the raster CRS
+            
+        Returns
+        -------
+        tuple or None
+            ``(float32 array, transform)``, or None if the raster is missing
+        """
+        if lbl in self._prob_arrays:
+            return self._prob_arrays[lbl]
+        
+        tif_path = self.prob_paths.get(
+            lbl, self.out_dir / f"probability_{lbl.replace('+', 'plus')}.tif"
+        )
+        if not tif_path.exists():
+            return None
+        
+        with rasterio.open(tif_path) as src:
+            window = window_from_bounds(*bounds, transform=src.transform)
+            window = window.round_offsets(op='floor').round_lengths(op='ceil')
+            window = window.intersection(Window(0, 0, src.width, src.height))
+            arr = src.read(1, window=window).astype(np.float32, copy=False)
+            return arr, src.window_transform(window)
+    
+    def _zonal_probability(self, gdf: gpd.GeoDataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and max ensemble probability under each AOI.
+        
+        Parameters
+        ----------
+        gdf : gpd.GeoDataFrame
+            AOIs in EPSG:4326 with a ``bin`` column
+            
+        Returns
+        -------
+        tuple of np.ndarray
+            Mean and max probability per row (NaN where no raster applies)
+        """
+        mean_prob = np.full(len(gdf), np.nan)
+        max_prob = np.full(len(gdf), np.nan)
+        
+        geoms = np.asarray(gdf.geometry.values)
+        bins = gdf['bin'].to_numpy()
+        
+        # Visit AOIs in Hilbert order so consecutive masks hit nearby pixels
+        order = np.argsort(gdf.geometry.hilbert_distance().to_numpy(), kind='stable')
+        
+        for lbl in self.bin_labels:
+            pos = order[bins[order] == lbl]
+            if len(pos) == 0:
+                continue
+            
+            bounds = shapely.bounds(geoms[pos])
+            try:
+                raster = self._read_probability(lbl, (
+                    bounds[:, 0].min(), bounds[:, 1].min(),
+                    bounds[:, 2].max(), bounds[:, 3].max()
+                ))
+            except Exception as e:
+                warnings.warn(f"Failed to read probability raster for bin {lbl}: {e}")
+                continue
+            if raster is None:
+                continue
+            
+            # Pixel windows for every AOI bbox in one vectorized pass
+            arr, transform = raster
+            height, width = arr.shape
+            c0 = np.floor((bounds[:, 0] - transform.c) / transform.a).astype(np.int64)
+            c1 = np.ceil((bounds[:, 2] - transform.c) / transform.a).astype(np.int64)
+            r0 = np.floor((bounds[:, 3] - transform.f) / transform.e).astype(np.int64)
+            r1 = np.ceil((bounds[:, 1] - transform.f) / transform.e).astype(np.int64)
+            np.clip(c0, 0, width, out=c0)
+            np.clip(c1, 0, width, out=c1)
+            np.clip(r0, 0, height, out=r0)
+            np.clip(r1, 0, height, out=r1)
+            
+            for i, p in enumerate(pos):
+                if r1[i] <= r0[i] or c1[i] <= c0[i]:
+                    continue
+                
+                window = Window(c0[i], r0[i], c1[i] - c0[i], r1[i] - r0[i])
+                sub = arr[r0[i]:r1[i], c0[i]:c1[i]]
+                sub_transform = window_transform(window, transform)
+                mask = _burn_mask(geoms[p:p + 1], sub.shape, sub_transform).view(bool)
+                if not mask.any():
+                    # AOI smaller than a pixel: fall back to touched pixels
+                    mask = _burn_mask(
+                        geoms[p:p + 1], sub.shape, sub_transform, all_touched=True
+                    ).view(bool)
+                
+                values = sub[mask]
+                if values.size:
+                    mean_prob[p] = values.mean()
+                    max_prob[p] = values.max()
+        
+        return mean_prob, max_prob
+    
+    @staticmethod
+    def _aggregate_by_centroid(gdf_all: gpd.GeoDataFrame) -> pd.DataFrame:
+        """
+        Group AOIs by 0.1° centroid cell and bin, aggregating with NumPy.
+        
+        Groups come from integer cell keys via ``np.unique`` (same order as
+        a sorted ``groupby``); sums, means and maxima are bincount/ufunc
+        reductions over the group ids, and the list columns are sliced out
+        of one stable sort instead of a Python call per group.
+        
+        Parameters
+        ----------
+        gdf_all : gpd.GeoDataFrame
+            AOIs with ``centroid_lon``/``centroid_lat`` (rounded to 0.1°)
+            
+        Returns
+        -------
+        pd.DataFrame
+            One row per (centroid_lon, centroid_lat, bin)
+        """
+        lon_key = np.rint(gdf_all['centroid_lon'].to_numpy() * 10).astype(np.int64)
+        lat_key = np.rint(gdf_all['centroid_lat'].to_numpy() * 10).astype(np.int64)
+        bin_codes, _ = pd.factorize(gdf_all['bin'], sort=True)
+        
+        _, first, inverse, sizes = np.unique(
+            np.stack([lon_key, lat_key, bin_codes]), axis=1,
+            return_index=True, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.ravel()
+        n_groups = len(first)
+        
+        def group_sum(col):
+            values = gdf_all[col].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            return np.bincount(inverse[valid], weights=values[valid], minlength=n_groups), valid
+        
+        def group_mean(col):
+            total, valid = group_sum(col)
+            n_valid = np.bincount(inverse[valid], minlength=n_groups)
+            return np.divide(total, n_valid, out=np.full(n_groups, np.nan), where=n_valid > 0)
+        
+        def group_max(col):
+            values = gdf_all[col].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            out = np.full(n_groups, -np.inf)
+            np.maximum.at(out, inverse[valid], values[valid])
+            out[np.bincount(inverse[valid], minlength=n_groups) == 0] = np.nan
+            return out
+        
+        # Rows of each group, in original order, from one stable sort
+        order = np.argsort(inverse, kind='stable')
+        splits = np.concatenate([[0], np.cumsum(sizes)])
+        
+        def group_lists(col):
+            values = gdf_all[col].to_numpy()[order].tolist()
+            return [values[lo:hi] for lo, hi in zip(splits[:-1], splits[1:])]
+        
+        dates = [sorted(set(v)) for v in group_lists('date')]
+        fxxs = [sorted(set(v)) for v in group_lists('fxx')]
+        
+        grouped = pd.DataFrame({
+            'centroid_lon': gdf_all['centroid_lon'].to_numpy()[first],
+            'centroid_lat': gdf_all['centroid_lat'].to_numpy()[first],
+            'bin': gdf_all['bin'].to_numpy()[first],
+            'mean_precip_mm': group_mean('mean_precip_mm'),
+            'max_precip_mm': group_max('max_precip_mm'),
+            'area_deg2': group_sum('area_deg2')[0],
+            'mean_probability': group_mean('mean_probability'),
+            'max_probability': group_max('max_probability'),
+            'method': group_lists('method'),
+            'date': dates,
+            'fxx': fxxs,
+            'file_name': [sorted(set(v)) for v in group_lists('file_name')],
+            'aoi_id': gdf_all['aoi_id'].to_numpy()[first]
+        })
+        
+        grouped['ensemble_count'] = sizes
+        grouped['date_list'] = [','.join(v) for v in dates]
+        grouped['fxx_list'] = [','.join(map(str, v)) for v in fxxs]
+        return grouped
+    
+    def _indexed_census(self, census_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Census layer in EPSG:4326 with its STRtree built.
+        
+        The reprojected layer is kept on the processor so repeated rankings
+        against the same census frame reuse one index.
+        
+        Parameters
+        ----------
+        census_gdf : gpd.GeoDataFrame
+            Census data as passed by the caller
+            
+        Returns
+        -------
+        gpd.GeoDataFrame
+            Census data in EPSG:4326
+        """
+        if self._census_layer is not None and self._census_layer[0] is census_gdf:
+            return self._census_layer[1]
+        
+        census_wgs84 = _ensure_wgs84(census_gdf, "census")
+        census_wgs84.sindex
+        self._census_layer = (census_gdf, census_wgs84)
+        return census_wgs84
+    
+    @staticmethod
+    def _population_by_cell(
+        grouped: pd.DataFrame,
+        gdf_all: gpd.GeoDataFrame,
+        census_gdf: gpd.GeoDataFrame
+    ) -> np.ndarray:
+        """
+        Area-weighted census population under each grouped AOI's centroid cell.
+        
+        All AOIs in a (centroid_lon, centroid_lat) cell are unioned once,
+        then one STRtree query pairs every cell with the census features it
+        intersects. Each feature contributes its population times the
+        fraction of its area inside the cell's union.
+        
+        Parameters
+        ----------
+        grouped : pd.DataFrame
+            Output of ``_aggregate_by_centroid``
+        gdf_all : gpd.GeoDataFrame
+            Individual AOIs with centroid cell columns, in EPSG:4326
+        census_gdf : gpd.GeoDataFrame
+            Census features in EPSG:4326
+            
+        Returns
+        -------
+        np.ndarray
+            Population (int) per row of ``grouped``
+        """
+        population = np.zeros(len(grouped), dtype=np.int64)
+        
+        # Find population column (case-insensitive)
+        pop_col = None
+        possible_cols = ['Population', 'POPULATION', 'population', 'U7H001', 'POP']
+        print(f"[DEBUG] Census columns: {list(census_gdf.columns)}")
+        for col in possible_cols:
+            if col in census_gdf.columns:
+                pop_col = col
+                print(f"[DEBUG] Using population column: {pop_col}")
+                break
+        if pop_col is None:
+            print(f"[WARNING] No population column found")
+            return population
+        
+        try:
+            # One union per centroid cell (the bin does not matter here)
+            cell_keys = np.stack([
+                np.rint(gdf_all['centroid_lon'].to_numpy() * 10),
+                np.rint(gdf_all['centroid_lat'].to_numpy() * 10)
+            ]).astype(np.int64)
+            cells, cell_of_aoi = np.unique(cell_keys, axis=1, return_inverse=True)
+            cell_of_aoi = cell_of_aoi.ravel()
+            
+            geoms = np.asarray(gdf_all.geometry.values)
+            order = np.argsort(cell_of_aoi, kind='stable')
+            splits = np.flatnonzero(np.diff(cell_of_aoi[order])) + 1
+            cell_geoms = np.array([
+                members[0] if len(members) == 1 else shapely.union_all(members)
+                for members in np.split(geoms[order], splits)
+            ], dtype=object)
+            
+            # Every (cell, census feature) intersecting pair from one tree query
+            census_geoms = np.asarray(census_gdf.geometry.values)
+            cell_idx, census_idx = census_gdf.sindex.query(cell_geoms, predicate='intersects')
+            
+            # Weight population by intersection area fraction; features lying
+            # wholly inside their cell count in full without an overlay
+            shapely.prepare(cell_geoms)
+            pair_cells = cell_geoms[cell_idx]
+            pair_census = census_geoms[census_idx]
+            area_fraction = np.ones(len(cell_idx), dtype=np.float64)
+            partial = ~shapely.covers(pair_cells, pair_census)
+            inter_area = shapely.area(shapely.intersection(pair_cells[partial], pair_census[partial]))
+            area_fraction[partial] = inter_area / shapely.area(pair_census[partial])
+            pop_values = census_gdf[pop_col].to_numpy(dtype=np.float64)[census_idx]
+            weighted_pop = pop_values * area_fraction
+            weighted_pop[np.isnan(weighted_pop)] = 0.0
+            cell_pop = np.bincount(cell_idx, weights=weighted_pop, minlength=len(cells[0]))
+            
+            # Map each grouped row to its cell
+            row_keys = np.stack([
+                np.rint(grouped['centroid_lon'].to_numpy() * 10),
+                np.rint(grouped['centroid_lat'].to_numpy() * 10)
+            ]).astype(np.int64)
+            lookup = {key: i for i, key in enumerate(zip(*cells))}
+            row_cells = np.array([lookup[key] for key in zip(*row_keys)], dtype=np.intp)
+            population = cell_pop[row_cells].astype(np.int64)
+            
+            n_features = np.bincount(cell_idx, minlength=len(cells[0]))
+            for idx in range(min(3, len(grouped))):
+                c = row_cells[idx]
+                if n_features[c] == 0:
+                    print(f"[DEBUG] Row {idx}: No intersecting census features")
+                else:
+                    print(f"[DEBUG] Row {idx}: {n_features[c]} census features, Population = {population[idx]:,}")
+                    
+        except Exception as e:
+            print(f"[WARNING] Error calculating population: {e}")
+        
+        return population
+    
     def rank_aois_by_probability(
         self,
         census_gdf: Optional[gpd.GeoDataFrame] = None,
@@ -359,158 +929,72 @@ class EnsembleProcessor:
         print("RANKING AOIs BY ENSEMBLE PROBABILITY")
         print("="*70)
         
-        # Collect all AOIs with their ensemble counts
-        aoi_data = []
+        # Collect all AOIs with their ensemble counts, one columnar frame per member
+        aoi_frames = []
         
         for mem in self.members:
             try:
-                gdf = gpd.read_file(mem["path"])
+                gdf = self._member_gdf(mem)
                 if gdf.empty:
                     continue
                 
-                gdf = gdf.to_crs(epsg=4326)
-                
                 # Extract file identifier
                 file_name = mem['path'].stem  # e.g., "F12_T100_aois"
+                geoms = gdf.geometry.values
                 
-                for idx, row in gdf.iterrows():
-                    aoi_data.append({
-                        'method': mem['method'],
-                        'date': mem['date'],
-                        'fxx': mem['fxx'],
-                        'threshold': mem['thr'],
-                        'bin': self.threshold_to_bin_label(mem['thr']),
-                        'file_name': file_name,
-                        'aoi_id': row.get('id', idx),
-                        'geometry': row['geometry'],
-                        'mean_precip_mm': row.get('mean_precip_mm', 0),
-                        'max_precip_mm': row.get('max_precip_mm', 0),
-                        'area_deg2': row.get('area_deg2', row['geometry'].area)
-                    })
+                def column(name, default):
+                    return gdf[name].to_numpy() if name in gdf.columns else default
+                
+                aoi_frames.append(pd.DataFrame({
+                    'method': mem['method'],
+                    'date': mem['date'],
+                    'fxx': mem['fxx'],
+                    'threshold': mem['thr'],
+                    'bin': self.threshold_to_bin_label(mem['thr']),
+                    'file_name': file_name,
+                    'aoi_id': column('id', gdf.index.to_numpy()),
+                    'geometry': geoms,
+                    'mean_precip_mm': column('mean_precip_mm', 0),
+                    'max_precip_mm': column('max_precip_mm', 0),
+                    # GEOS areas only for members written without the field
+                    'area_deg2': (
+                        gdf['area_deg2'].to_numpy() if 'area_deg2' in gdf.columns
+                        else shapely.area(np.asarray(geoms))
+                    )
+                }))
                     
             except Exception as e:
                 warnings.warn(f"Failed to process {mem['path']}: {e}")
                 continue
         
-        if not aoi_data:
+        if not aoi_frames:
             print("No AOI data found")
             return pd.DataFrame()
         
         # Create DataFrame
-        df = pd.DataFrame(aoi_data)
-        gdf_all = gpd.GeoDataFrame(df, geometry='geometry', crs='EPSG:4326')
+        df = pd.concat(aoi_frames, ignore_index=True)
+        gdf_all = gpd.GeoDataFrame(df, geometry='geometry', crs=WGS84)
+        
+        # Probability under each AOI from the in-memory bin rasters
+        gdf_all['mean_probability'], gdf_all['max_probability'] = self._zonal_probability(gdf_all)
         
         # Aggregate by spatial overlap (simplified: group by centroid proximity)
         print("Aggregating spatially overlapping AOIs...")
-        gdf_all['centroid_lon'] = gdf_all.geometry.centroid.x.round(1)
-        gdf_all['centroid_lat'] = gdf_all.geometry.centroid.y.round(1)
-        
-        grouped = gdf_all.groupby(['centroid_lon', 'centroid_lat', 'bin']).agg({
-            'mean_precip_mm': 'mean',
-            'max_precip_mm': 'max',
-            'area_deg2': 'sum',
-            'method': lambda x: list(x),
-            'date': lambda x: list(set(x)),
-            'fxx': lambda x: list(set(x)),
-            'file_name': lambda x: list(set(x)),
-            'aoi_id': 'first'
-        }).reset_index()
-        
-        grouped['ensemble_count'] = grouped['method'].apply(len)
-        grouped['date_list'] = grouped['date'].apply(lambda x: ','.join(sorted(x)))
-        grouped['fxx_list'] = grouped['fxx'].apply(lambda x: ','.join(map(str, sorted(x))))
+        centroids = shapely.centroid(np.asarray(gdf_all.geometry.values))
+        gdf_all['centroid_lon'] = np.round(shapely.get_x(centroids), 1)
+        gdf_all['centroid_lat'] = np.round(shapely.get_y(centroids), 1)
+        
+        grouped = self._aggregate_by_centroid(gdf_all)
         
         # Add population if census data provided
         if census_gdf is not None:
             print("Computing population statistics...")
             
-            # CRITICAL: Ensure census data is in EPSG:4326
-            if census_gdf.crs is None:
-                print("WARNING: Census data has no CRS, assuming EPSG:4326")
-                census_gdf = census_gdf.set_crs("EPSG:4326")
-            elif census_gdf.crs.to_string() != "EPSG:4326":
-                print(f"Converting census from {census_gdf.crs.to_string()} to EPSG:4326")
-                census_gdf = census_gdf.to_crs("EPSG:4326")
-            
-            # Ensure AOI data is in EPSG:4326
-            if gdf_all.crs is None:
-                gdf_all = gdf_all.set_crs("EPSG:4326")
-            elif gdf_all.crs.to_string() != "EPSG:4326":
-                print(f"Converting AOIs from {gdf_all.crs.to_string()} to EPSG:4326")
-                gdf_all = gdf_all.to_crs("EPSG:4326")
-            
-            from shapely.ops import unary_union
-            pop_list = []
-            
-            for idx, row in grouped.iterrows():
-                # Get ALL geometries for this grouped centroid location
-                matching_rows = gdf_all[
-                    (gdf_all['centroid_lon'] == row['centroid_lon']) &
-                    (gdf_all['centroid_lat'] == row['centroid_lat'])
-                ]
-                
-                if len(matching_rows) == 0:
-                    pop_list.append(0)
-                    continue
-                
-                # Create union of ALL matching AOI geometries
-                geom_list = matching_rows.geometry.tolist()
-                if len(geom_list) == 1:
-                    combined_geom = geom_list[0]
-                else:
-                    combined_geom = unary_union(geom_list)
-                
-                try:
-                    # Spatial intersection with census - use actual intersection geometry
-                    intersecting_census = census_gdf[census_gdf.intersects(combined_geom)].copy()
-                    
-                    if len(intersecting_census) == 0:
-                        pop_list.append(0)
-                        if idx < 3:
-                            print(f"[DEBUG] Row {idx}: No intersecting census features")
-                        continue
-                    
-                    # Calculate actual intersection area for weighting
-                    intersecting_census['intersection_geom'] = intersecting_census.geometry.intersection(combined_geom)
-                    intersecting_census['intersection_area'] = intersecting_census['intersection_geom'].area
-                    intersecting_census['original_area'] = intersecting_census.geometry.area
-                    intersecting_census['area_fraction'] = intersecting_census['intersection_area'] / intersecting_census['original_area']
-                    
-                    # Find population column (case-insensitive)
-                    pop_col = None
-                    possible_cols = ['Population', 'POPULATION', 'population', 'U7H001', 'POP']
-                    
-                    if idx == 0:
-                        print(f"[DEBUG] Census columns: {list(intersecting_census.columns)}")
-                    
-                    for col in possible_cols:
-                        if col in intersecting_census.columns:
-                            pop_col = col
-                            if idx == 0:
-                                print(f"[DEBUG] Using population column: {pop_col}")
-                            break
-                    
-                    if pop_col:
-                        # Weight population by intersection area fraction
-                        intersecting_census['weighted_pop'] = intersecting_census[pop_col] * intersecting_census['area_fraction']
-                        pop_value = intersecting_census['weighted_pop'].sum()
-                        pop = int(pop_value)
-                        
-                        if idx < 3:
-                            print(f"[DEBUG] Row {idx}: {len(intersecting_census)} census features, Population = {pop:,}")
-                    else:
-                        pop = 0
-                        if idx == 0:
-                            print(f"[WARNING] No population column found")
-                    
-                    pop_list.append(pop)
-                    
-                except Exception as e:
-                    pop_list.append(0)
-                    if idx < 3:
-                        print(f"[WARNING] Row {idx}: Error calculating population: {e}")
+            # CRITICAL: Ensure census and AOI data are in EPSG:4326
+            census_gdf = self._indexed_census(census_gdf)
+            gdf_all = _ensure_wgs84(gdf_all, "AOIs")
             
-            grouped['population_affected'] = pop_list
+            grouped['population_affected'] = self._population_by_cell(grouped, gdf_all, census_gdf)
         
         # Sort by ensemble count (highest probability)
         grouped = grouped.sort_values('ensemble_count', ascending=False)
@@ -528,7 +1012,7 @@ class EnsembleProcessor:
         print("-" * 100)
         
         cols_to_display = ['file_name', 'aoi_id', 'bin', 'ensemble_count', 
-                          'mean_precip_mm', 'area_deg2']
+                          'max_probability', 'mean_precip_mm', 'area_deg2']
         if 'population_affected' in top_aois.columns:
             cols_to_display.append('population_affected')
         
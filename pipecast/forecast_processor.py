@@ -6,22 +6,71 @@ Handles weather data fetching, AOI generation, and enhanced analysis.
 
 import os
 import json
+import pickle
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
 import geopandas as gpd
 import rasterio
 from rasterio import features
-from rasterio.transform import from_bounds
+from rasterio.transform import Affine, from_bounds
+from rasterio.windows import Window
+from scipy import ndimage
 from scipy.ndimage import label
-from shapely.geometry import shape
-from herbie import Herbie
+import shapely
+from herbie import Herbie, FastHerbie
 
 from .config import ForecastConfig, WeatherDataset
-from .data_manager import DataManager
+from .data_manager import DataManager, AOI_SUFFIXES, MAX_LAYER_WORKERS, write_aoi_file
+
+# Optional dependencies
+try:
+    import cc3d
+    CC3D_AVAILABLE = True
+except ImportError:
+    CC3D_AVAILABLE = False
+
+
+def _label_regions(mask: np.ndarray, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+    """
+    Label 4-connected regions of a boolean mask.
+    
+    Uses cc3d's C++ labeler when installed, otherwise
+    ``scipy.ndimage.label``; both number regions in raster-scan order, so
+    the labels are identical.
+    
+    Parameters
+    ----------
+    mask : np.ndarray
+        2-D boolean mask
+    out : np.ndarray, optional
+        int32 array of ``mask.shape`` that scipy labels into instead of
+        allocating (cc3d always returns a new array)
+        
+    Returns
+    -------
+    tuple
+        (int32 label raster, number of regions)
+    """
+    if CC3D_AVAILABLE:
+        labeled, num_features = cc3d.connected_components(
+            np.ascontiguousarray(mask), connectivity=4, return_N=True, out_dtype=np.uint32
+        )
+        # Label ids stay far below 2**31, so reinterpret for features.shapes
+        return labeled.view(np.int32), int(num_features)
+    
+    if out is not None:
+        return out, label(mask, output=out)
+    
+    labeled, num_features = label(mask)
+    return labeled, num_features
 
 
 class ForecastProcessor:
@@ -35,7 +84,7 @@ class ForecastProcessor:
     4. Saves results and generates summaries
     """
     
-    def __init__(self, config: ForecastConfig):
+    def __init__(self, config: ForecastConfig, layers: Optional[Dict] = None):
         """
         Initialize ForecastProcessor.
         
@@ -43,6 +92,9 @@ class ForecastProcessor:
         ----------
         config : ForecastConfig
             Configuration object
+        layers : dict, optional
+            Enhanced layers exported by another processor's
+            ``_export_layers``; when given, nothing is loaded from disk
         """
         self.config = config
         self.data_manager = DataManager()
@@ -54,60 +106,201 @@ class ForecastProcessor:
         # Results storage
         self.results: Dict = {}
         
+        # GRIB subsets fetched by download_forecast_batch, not yet read
+        self._batch_files: set = set()
+        self._batched_dates: set = set()
+        
         # Enhanced layers
         self.census_gdf: Optional[gpd.GeoDataFrame] = None
         self.watershed_gdf: Optional[gpd.GeoDataFrame] = None
         self.custom_layers: Dict[str, gpd.GeoDataFrame] = {}
         self.land_boundary: Optional[gpd.GeoDataFrame] = None
+        self._census_pop: Optional[np.ndarray] = None
+        
+        # (dataset, transform) of the most recently georeferenced forecast
+        self._grid_cache: Optional[Tuple[any, Affine]] = None
+        self._labeled_buf: Optional[np.ndarray] = None
         
         # Load enhanced layers if needed
-        self._load_enhanced_layers()
+        if layers is None:
+            self._load_enhanced_layers()
+        else:
+            self.census_gdf = layers['census']
+            self.watershed_gdf = layers['watershed']
+            self.custom_layers = dict(layers['custom'])
+            if layers['census_is_land']:
+                self.land_boundary = self.census_gdf
+        self._index_layers()
     
     def _load_enhanced_layers(self):
         """Load enhanced layers based on configuration."""
-        if not any([
-            self.config.use_census,
-            self.config.use_watershed,
-            self.config.custom_layers
-        ]):
+        # Only the enhanced method joins layers; census is also the land
+        # boundary, so standard-only runs still need it for clipping
+        enhanced = "enhanced" in self.config.forecast_methods
+        use_census = self.config.use_census and (enhanced or self.config.clip_to_land)
+        use_watershed = self.config.use_watershed and enhanced
+        custom_paths = (self.config.custom_layers or {}) if enhanced else {}
+        if not any([use_census, use_watershed, custom_paths]):
             return
         
         print("\n" + "="*70)
         print("LOADING ENHANCED LAYERS")
         print("="*70)
         
-        # Load census
-        if self.config.use_census:
-            try:
-                self.census_gdf = self.data_manager.download_census_data(
-                    self.config.census_zenodo_url
+        # Layers are independent downloads/reads, so load them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_LAYER_WORKERS, 2 + len(custom_paths))) as executor:
+            fut_census = fut_watershed = None
+            if use_census:
+                fut_census = executor.submit(
+                    self.data_manager.download_census_data, self.config.census_zenodo_url
                 )
-                # Use census as land boundary for clipping
-                self.land_boundary = self.census_gdf
-            except Exception as e:
-                warnings.warn(f"Failed to load census data: {e}")
-        
-        # Load watershed
-        if self.config.use_watershed:
-            try:
-                self.watershed_gdf = self.data_manager.download_watershed_data(
-                    self.config.watershed_zenodo_url
+            if use_watershed:
+                fut_watershed = executor.submit(
+                    self.data_manager.download_watershed_data, self.config.watershed_zenodo_url
                 )
-            except Exception as e:
-                warnings.warn(f"Failed to load watershed data: {e}")
-        
-        # Load custom layers
-        if self.config.custom_layers:
-            for name, filepath in self.config.custom_layers.items():
+            fut_custom = {
+                name: executor.submit(self.data_manager.load_custom_layer, name, filepath)
+                for name, filepath in custom_paths.items()
+            }
+            
+            # Load census
+            if fut_census is not None:
+                try:
+                    self.census_gdf = fut_census.result()
+                    # Use census as land boundary for clipping
+                    self.land_boundary = self.census_gdf
+                except Exception as e:
+                    warnings.warn(f"Failed to load census data: {e}")
+            
+            # Load watershed
+            if fut_watershed is not None:
+                try:
+                    self.watershed_gdf = fut_watershed.result()
+                except Exception as e:
+                    warnings.warn(f"Failed to load watershed data: {e}")
+            
+            # Load custom layers
+            for name, future in fut_custom.items():
                 try:
-                    self.custom_layers[name] = self.data_manager.load_custom_layer(
-                        name, filepath
-                    )
+                    self.custom_layers[name] = future.result()
                 except Exception as e:
                     warnings.warn(f"Failed to load custom layer '{name}': {e}")
         
         print("="*70 + "\n")
     
+    def _index_layers(self):
+        """
+        Align enhanced layers to the target CRS and build their spatial indexes.
+        
+        Done once per processor so every forecast reuses the same STRtree and
+        prepared geometries instead of rebuilding them for each join.
+        """
+        target_crs = self.config.target_crs
+        
+        def prepare(layer_gdf):
+            if layer_gdf is None or layer_gdf.empty:
+                return layer_gdf
+            if layer_gdf.crs is not None and layer_gdf.crs != target_crs:
+                layer_gdf = layer_gdf.to_crs(target_crs)
+            # Build the STRtree now; geopandas caches it on the layer
+            layer_gdf.sindex
+            shapely.prepare(np.asarray(layer_gdf.geometry.values))
+            return layer_gdf
+        
+        self.census_gdf = prepare(self.census_gdf)
+        self.watershed_gdf = prepare(self.watershed_gdf)
+        self.custom_layers = {
+            name: prepare(layer_gdf) for name, layer_gdf in self.custom_layers.items()
+        }
+        
+        # Census doubles as the land boundary for clipping
+        if self.land_boundary is not None:
+            self.land_boundary = self.census_gdf
+        
+        # Resolve the population column once rather than per forecast
+        self._census_pop = None
+        if self.census_gdf is not None:
+            pop_columns = ['U7H001', 'population', 'POP', 'POPULATION']
+            pop_col = next((col for col in pop_columns if col in self.census_gdf.columns), None)
+            if pop_col:
+                self._census_pop = self.census_gdf[pop_col].to_numpy()
+    
+    def _export_layers(self) -> Dict:
+        """Bundle the loaded enhanced layers for ``ForecastProcessor(layers=...)``."""
+        return {
+            'census': self.census_gdf,
+            'watershed': self.watershed_gdf,
+            'custom': self.custom_layers,
+            'census_is_land': self.land_boundary is not None
+        }
+    
+    def _share_layers(self) -> Optional[SharedMemory]:
+        """
+        Pickle the enhanced layers into a shared memory block for pool workers.
+        
+        Workers unpickle the block instead of each re-reading and
+        reprojecting the shapefiles. The caller must close and unlink it.
+        
+        Returns
+        -------
+        SharedMemory or None
+            The block, or None when no layers are loaded
+        """
+        if self.census_gdf is None and self.watershed_gdf is None and not self.custom_layers:
+            return None
+        
+        payload = pickle.dumps(self._export_layers(), protocol=pickle.HIGHEST_PROTOCOL)
+        shm = SharedMemory(create=True, size=len(payload))
+        shm.buf[:len(payload)] = payload
+        return shm
+    
+    def download_forecast_batch(self, date: datetime, fxx_list: List[int]) -> List[Path]:
+        """
+        Download several forecast hours of one date in a single concurrent batch.
+        
+        ``fetch_forecast_data`` then reads the local GRIB subsets instead of
+        downloading each forecast hour separately. Failures only warn; any
+        hour missing locally is downloaded on demand as before.
+        
+        Parameters
+        ----------
+        date : datetime
+            Forecast initialization date
+        fxx_list : list of int
+            Forecast hours to download
+            
+        Returns
+        -------
+        list
+            Paths of the downloaded GRIB subsets
+        """
+        print(f"  Batch downloading {self.config.weather_dataset.value} data for "
+              f"{date:%Y-%m-%d} ({len(fxx_list)} forecast hours)...")
+        
+        try:
+            FH = FastHerbie(
+                [date],
+                fxx=list(fxx_list),
+                model=self.config.get_model_name(),
+                product=self.config.product,
+                verbose=False
+            )
+            # Subsets already on disk belong to the user's cache; only files
+            # this batch creates are removed once they have been read
+            existing = {
+                path for path in (
+                    Path(H.get_localFilePath(self.config.variable)) for H in FH.objects
+                )
+                if path.exists()
+            }
+            paths = [Path(p) for p in FH.download(self.config.variable) if p]
+        except Exception as e:
+            warnings.warn(f"Batch download failed for {date:%Y-%m-%d}: {e}")
+            return []
+        
+        self._batch_files.update(p for p in paths if p not in existing)
+        return paths
+    
     def fetch_forecast_data(self, date: datetime, fxx: int) -> Tuple[np.ndarray, any]:
         """
         Fetch weather forecast data using Herbie.
@@ -135,8 +328,20 @@ class ForecastProcessor:
                 verbose=False
             )
             
-            ds = H.xarray(self.config.variable)
-            precip_data = ds[self.config.variable_name].values
+            local_file = Path(H.get_localFilePath(self.config.variable))
+            if local_file in self._batch_files:
+                # Read the batch-downloaded subset, then remove it as Herbie
+                # would have removed its own download, even if reading fails
+                try:
+                    ds = H.xarray(self.config.variable, remove_grib=False).load()
+                finally:
+                    self._batch_files.discard(local_file)
+                    local_file.unlink(missing_ok=True)
+            else:
+                ds = H.xarray(self.config.variable)
+            # Precipitation needs no more than float32 precision; decoders that
+            # hand back float64 would double the traffic of every later pass
+            precip_data = ds[self.config.variable_name].values.astype(np.float32, copy=False)
             
             return precip_data, ds
             
@@ -148,7 +353,8 @@ class ForecastProcessor:
         precip_data: np.ndarray,
         ds: any,
         threshold: float,
-        min_area: Optional[float] = None
+        min_area: Optional[float] = None,
+        mask: Optional[np.ndarray] = None
     ) -> gpd.GeoDataFrame:
         """
         Generate Areas of Interest from precipitation data.
@@ -163,6 +369,8 @@ class ForecastProcessor:
             Precipitation threshold in mm
         min_area : float, optional
             Minimum area for AOI polygons
+        mask : np.ndarray, optional
+            Precomputed ``precip_data > threshold`` (see ``_threshold_levels``)
             
         Returns
         -------
@@ -173,18 +381,22 @@ class ForecastProcessor:
             min_area = self.config.min_aoi_area
         
         # Create binary mask
-        mask = precip_data > threshold
+        if mask is None:
+            mask = precip_data > threshold
+        
+        # Nothing exceeds the threshold: skip the labeling pass entirely
+        if not mask.any():
+            return self._empty_aois()
         
-        # Label connected regions
-        labeled, num_features = label(mask)
+        # Label connected regions into a buffer reused across thresholds and
+        # forecasts of the same grid
+        if self._labeled_buf is None or self._labeled_buf.shape != mask.shape:
+            self._labeled_buf = np.empty(mask.shape, dtype=np.int32)
+        labeled, num_features = _label_regions(mask, out=self._labeled_buf)
         
         if num_features == 0:
             # No AOIs found
-            return gpd.GeoDataFrame(
-                columns=['id', 'mean_precip_mm', 'max_precip_mm', 'area_deg2'],
-                geometry=[],
-                crs=self.config.target_crs
-            )
+            return self._empty_aois()
         
         # # Build transform for geolocation
         # transform = from_bounds(
@@ -196,27 +408,8 @@ class ForecastProcessor:
         #     ds.dims["y"]
         # )
 
-        # Build transform for geolocation
-        # CRITICAL: Convert HRRR longitude from 0-360 to -180-180
-        lon_min = float(ds.longitude.min())
-        lon_max = float(ds.longitude.max())
-        lat_min = float(ds.latitude.min())
-        lat_max = float(ds.latitude.max())
-
-        # Convert longitude if in 0-360 range
-        if lon_min > 180:
-            lon_min -= 360
-        if lon_max > 180:
-            lon_max -= 360
-
-        print(f"  Longitude range: {lon_min:.2f} to {lon_max:.2f}")
-        print(f"  Latitude range: {lat_min:.2f} to {lat_max:.2f}")
-
-        transform = from_bounds(
-            lon_min, lat_min, lon_max, lat_max,
-            ds.dims["x"],
-            ds.dims["y"]
-        )
+        # Build transform for geolocation (once per forecast dataset)
+        transform = self._grid_transform(ds)
 
         # # Build transform for geolocation
         # # Note: HRRR uses (lon, lat) order, rasterio expects (west, south, east, north)
@@ -231,50 +424,258 @@ class ForecastProcessor:
         #     ds.dims["y"]
         # )
                 
-        # Convert labeled regions to shapes
+        # A region's polygon covers exactly its pixels, so pixel counts give
+        # every area up front; regions that are too small are never traced.
+        # The margin keeps borderline regions for the exact check below.
+        pixel_area = abs(transform.a * transform.e)
+        pixel_counts = np.bincount(labeled.ravel(), minlength=num_features + 1)
+        large_enough = pixel_counts * pixel_area >= min_area * (1 - 1e-9)
+        large_enough[0] = False
+        if not large_enough.any():
+            return self._empty_aois()
+        
+        # Restrict tracing and statistics to the window spanning the regions
+        # that survived; at high thresholds that is a small part of the grid
+        shape_mask = large_enough[labeled]
+        rows = np.flatnonzero(shape_mask.any(axis=1))
+        cols = np.flatnonzero(shape_mask.any(axis=0))
+        window = Window.from_slices((rows[0], rows[-1] + 1), (cols[0], cols[-1] + 1))
+        win_slices = window.toslices()
+        win_labeled = labeled[win_slices]
+        
+        # Convert labeled regions to shapes; ndimage.label's int32 output is
+        # passed as is (no int16 copy, which also wrapped past 32767 labels)
+        # Traced in pixel units so the window offset stays exact; the grid
+        # transform is applied to the assembled coordinates afterwards
         shapes = list(features.shapes(
-            labeled.astype(np.int16),
-            mask=mask,
-            transform=transform
+            win_labeled,
+            mask=shape_mask[win_slices],
+            transform=Affine.translation(window.col_off, window.row_off)
         ))
         
-        # Extract polygons and compute statistics
-        polygons = []
-        ids = []
-        mean_precips = []
-        max_precips = []
-        areas = []
+        # Per-label statistics over the window, indexed by label; the pixel
+        # counts above already give each mean's denominator, so one weighted
+        # bincount supplies the sums
+        keep_ids = np.flatnonzero(large_enough)
+        label_sums = np.bincount(
+            win_labeled.ravel(), weights=precip_data[win_slices].ravel(), minlength=num_features + 1
+        )
+        label_means = np.zeros(num_features + 1, dtype=np.float64)
+        label_maxes = np.zeros(num_features + 1, dtype=np.float64)
+        label_means[keep_ids] = label_sums[keep_ids] / pixel_counts[keep_ids]
+        label_maxes[keep_ids] = ndimage.maximum(precip_data[win_slices], win_labeled, index=keep_ids)
         
-        for geom, label_id in shapes:
-            if label_id == 0:
-                continue
+        # Build every labelled polygon in one batch, then filter by area
+        shape_geoms = [geom for geom, label_id in shapes if label_id != 0]
+        shape_ids = np.array([int(label_id) for _, label_id in shapes if label_id != 0], dtype=np.int64)
+        polygons = self._build_polygons(shape_geoms, transform)
+        areas = shapely.area(polygons)
+        keep = areas >= min_area
+        
+        shape_ids = shape_ids[keep]
+        
+        # Create GeoDataFrame straight from the arrays; the geometry is wrapped
+        # in a GeoSeries up front so no per-object inference or copy happens
+        gdf_aoi = gpd.GeoDataFrame({
+            'id': shape_ids,
+            'mean_precip_mm': label_means[shape_ids],
+            'max_precip_mm': label_maxes[shape_ids],
+            'area_deg2': areas[keep]
+        }, geometry=gpd.GeoSeries(polygons[keep], crs=self.config.target_crs), copy=False)
+        
+        return gdf_aoi
+    
+    def _grid_transform(self, ds) -> Affine:
+        """
+        Geotransform of a forecast grid, computed once per dataset.
+        
+        Every threshold and method of a forecast shares the same grid, so
+        the coordinate extremes are reduced once and the result is kept for
+        the most recent dataset.
+        
+        Parameters
+        ----------
+        ds : xarray.Dataset
+            Xarray dataset with ``longitude``/``latitude`` coordinates
             
-            poly = shape(geom)
+        Returns
+        -------
+        Affine
+            Transform from grid indices to lon/lat
+        """
+        cached = self._grid_cache
+        if cached is not None and cached[0] is ds:
+            return cached[1]
+        
+        # Pull each coordinate array out of xarray once
+        lon = ds.longitude.values
+        lat = ds.latitude.values
+        lon_min, lon_max = float(np.nanmin(lon)), float(np.nanmax(lon))
+        lat_min, lat_max = float(np.nanmin(lat)), float(np.nanmax(lat))
+        
+        # CRITICAL: Convert HRRR longitude from 0-360 to -180-180
+        if lon_min > 180:
+            lon_min -= 360
+        if lon_max > 180:
+            lon_max -= 360
+        
+        print(f"  Longitude range: {lon_min:.2f} to {lon_max:.2f}")
+        print(f"  Latitude range: {lat_min:.2f} to {lat_max:.2f}")
+        
+        transform = from_bounds(
+            lon_min, lat_min, lon_max, lat_max,
+            ds.sizes["x"],
+            ds.sizes["y"]
+        )
+        self._grid_cache = (ds, transform)
+        return transform
+    
+    @staticmethod
+    def _build_polygons(geoms: List[Dict], transform: Optional[Affine] = None) -> np.ndarray:
+        """
+        Build shapely polygons from GeoJSON-like polygon mappings in one batch.
+        
+        Rings from every mapping are concatenated into a single coordinate
+        buffer so ``shapely.linearrings``/``shapely.polygons`` construct all
+        geometries in compiled code instead of one ``shape()`` call each.
+        
+        Parameters
+        ----------
+        geoms : list of dict
+            Polygon mappings as yielded by ``rasterio.features.shapes``
+        transform : Affine, optional
+            Applied to every coordinate (e.g. pixel to map coordinates), the
+            same way GDAL applies a geotransform
             
-            # Filter by area
-            if poly.area < min_area:
-                continue
+        Returns
+        -------
+        np.ndarray
+            Polygons, one per mapping
+        """
+        if not geoms:
+            return np.empty(0, dtype=object)
+        
+        rings = [np.asarray(ring, dtype=np.float64) for geom in geoms for ring in geom["coordinates"]]
+        rings_per_polygon = [len(geom["coordinates"]) for geom in geoms]
+        
+        coords = np.concatenate(rings)
+        if transform is not None:
+            x, y = coords[:, 0], coords[:, 1]
+            coords = np.column_stack([
+                transform.c + x * transform.a + y * transform.b,
+                transform.f + x * transform.d + y * transform.e
+            ])
+        ring_index = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+        polygon_index = np.repeat(np.arange(len(geoms)), rings_per_polygon)
+        
+        linear_rings = shapely.linearrings(coords, indices=ring_index)
+        return shapely.polygons(linear_rings, indices=polygon_index)
+    
+    def _threshold_levels(self, precip_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classify every cell against all configured thresholds in one pass.
+        
+        Parameters
+        ----------
+        precip_data : np.ndarray
+            Precipitation data array
             
-            # Compute statistics for this AOI
-            aoi_mask = labeled == label_id
-            mean_precip = float(precip_data[aoi_mask].mean())
-            max_precip = float(precip_data[aoi_mask].max())
+        Returns
+        -------
+        tuple
+            (levels, sorted_thresholds) where ``levels`` counts the thresholds
+            each cell exceeds, so ``precip_data > sorted_thresholds[k]`` is
+            ``levels > k``
+        """
+        sorted_thresholds = np.unique(np.asarray(self.config.thresholds, dtype=np.float64))
+        level_dtype = np.uint8 if len(sorted_thresholds) < 256 else np.uint16
+        
+        # right=True counts thresholds strictly below each value
+        levels = np.digitize(precip_data, sorted_thresholds, right=True).astype(level_dtype)
+        levels[np.isnan(precip_data)] = 0
+        
+        return levels, sorted_thresholds
+    
+    def _empty_aois(self) -> gpd.GeoDataFrame:
+        """Return an AOI GeoDataFrame with the standard columns and no rows."""
+        return gpd.GeoDataFrame(
+            columns=['id', 'mean_precip_mm', 'max_precip_mm', 'area_deg2'],
+            geometry=[],
+            crs=self.config.target_crs
+        )
+    
+    @staticmethod
+    def _join_layer(
+        gdf_aoi: gpd.GeoDataFrame,
+        layer_gdf: gpd.GeoDataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find AOI/layer pairs using the layer's persistent spatial index.
+        
+        Only pairs whose interiors intersect are kept (edge-touching pairs
+        are dropped), matching the pairs ``gpd.overlay(how='intersection')``
+        would produce without building the intersection geometries.
+        
+        Parameters
+        ----------
+        gdf_aoi : gpd.GeoDataFrame
+            AOIs (query side)
+        layer_gdf : gpd.GeoDataFrame
+            Enhanced layer (indexed side)
             
-            polygons.append(poly)
-            ids.append(int(label_id))
-            mean_precips.append(mean_precip)
-            max_precips.append(max_precip)
-            areas.append(poly.area)
+        Returns
+        -------
+        tuple
+            (AOI geometries, layer geometries, layer row positions) per pair
+        """
+        aoi_geoms = np.asarray(gdf_aoi.geometry.values)
         
-        # Create GeoDataFrame
-        gdf_aoi = gpd.GeoDataFrame({
-            'id': ids,
-            'mean_precip_mm': mean_precips,
-            'max_precip_mm': max_precips,
-            'area_deg2': areas
-        }, geometry=polygons, crs=self.config.target_crs)
+        # A single bbox probe rejects layers that miss this forecast entirely
+        # (e.g. HRRR-AK AOIs against a CONUS-only layer) before the bulk query
+        if len(layer_gdf.sindex.query(shapely.box(*gdf_aoi.total_bounds))) == 0:
+            no_geoms = np.empty(0, dtype=object)
+            return no_geoms, no_geoms, np.empty(0, dtype=np.intp)
         
-        return gdf_aoi
+        # Query in Hilbert order so neighbouring AOIs walk the same subtrees
+        aoi_geoms = aoi_geoms[np.argsort(gdf_aoi.geometry.hilbert_distance().to_numpy(), kind='stable')]
+        aoi_pos, layer_pos = layer_gdf.sindex.query(aoi_geoms, predicate='intersects')
+        
+        # Layer geometries are prepared once in _index_layers
+        layer_geoms = np.asarray(layer_gdf.geometry.values)[layer_pos]
+        keep = ~shapely.touches(layer_geoms, aoi_geoms[aoi_pos])
+        
+        return aoi_geoms[aoi_pos[keep]], layer_geoms[keep], layer_pos[keep]
+    
+    @staticmethod
+    def _intersection_area(aoi_geoms: np.ndarray, layer_geoms: np.ndarray) -> np.ndarray:
+        """
+        Area of each AOI/layer pair's intersection.
+        
+        Pairs where one side covers the other take the smaller geometry's
+        area directly; only partial overlaps build intersection geometries.
+        
+        Parameters
+        ----------
+        aoi_geoms, layer_geoms : np.ndarray
+            Paired geometries from ``_join_layer``
+            
+        Returns
+        -------
+        np.ndarray
+            Intersection area per pair
+        """
+        shapely.prepare(aoi_geoms)
+        area = np.empty(len(aoi_geoms), dtype=np.float64)
+        
+        # Layer geometries are already prepared, AOIs just above
+        aoi_inside = shapely.covers(layer_geoms, aoi_geoms)
+        layer_inside = ~aoi_inside & shapely.covers(aoi_geoms, layer_geoms)
+        partial = ~(aoi_inside | layer_inside)
+        
+        area[aoi_inside] = shapely.area(aoi_geoms[aoi_inside])
+        area[layer_inside] = shapely.area(layer_geoms[layer_inside])
+        area[partial] = shapely.area(shapely.intersection(aoi_geoms[partial], layer_geoms[partial]))
+        return area
     
     def enhance_aois(
         self,
@@ -293,80 +694,63 @@ class ForecastProcessor:
         dict
             Enhancement statistics
         """
-        stats = {}
+        stats = {
+            'census_pop_sum': 0,
+            'census_features': 0,
+            'watershed_area_sum': 0,
+            'watershed_features': 0
+        }
+        for layer_name in self.custom_layers:
+            stats[f'{layer_name}_features'] = 0
+            stats[f'{layer_name}_area_sum'] = 0
+        
+        # Nothing to intersect (e.g. high thresholds): skip all layer joins
+        if gdf_aoi.empty or gdf_aoi.geometry.is_empty.all():
+            return stats
         
         # Census intersection
-        if self.census_gdf is not None and not gdf_aoi.empty:
+        if self.census_gdf is not None:
             try:
-                census_intersect = gpd.overlay(
-                    gdf_aoi,
-                    self.census_gdf,
-                    how='intersection'
-                )
-                
-                # Sum population (adjust column name as needed)
-                pop_columns = ['U7H001', 'population', 'POP', 'POPULATION']
-                pop_col = None
-                for col in pop_columns:
-                    if col in census_intersect.columns:
-                        pop_col = col
-                        break
+                _, _, census_pos = self._join_layer(gdf_aoi, self.census_gdf)
                 
-                if pop_col:
-                    stats['census_pop_sum'] = int(census_intersect[pop_col].sum())
+                # Sum population (column resolved in _index_layers)
+                if self._census_pop is not None:
+                    stats['census_pop_sum'] = int(self._census_pop[census_pos].sum())
                 else:
                     stats['census_pop_sum'] = 0
                     warnings.warn("No population column found in census data")
                 
-                stats['census_features'] = len(census_intersect)
+                stats['census_features'] = len(census_pos)
                 
             except Exception as e:
                 warnings.warn(f"Census intersection failed: {e}")
                 stats['census_pop_sum'] = 0
                 stats['census_features'] = 0
-        else:
-            stats['census_pop_sum'] = 0
-            stats['census_features'] = 0
         
         # Watershed intersection
-        if self.watershed_gdf is not None and not gdf_aoi.empty:
+        if self.watershed_gdf is not None:
             try:
-                ws_intersect = gpd.overlay(
-                    gdf_aoi,
-                    self.watershed_gdf,
-                    how='intersection'
-                )
+                aoi_geoms, ws_geoms, _ = self._join_layer(gdf_aoi, self.watershed_gdf)
                 
                 # Sum watershed area
-                stats['watershed_area_sum'] = float(ws_intersect.geometry.area.sum())
-                stats['watershed_features'] = len(ws_intersect)
+                stats['watershed_area_sum'] = float(self._intersection_area(aoi_geoms, ws_geoms).sum())
+                stats['watershed_features'] = len(ws_geoms)
                 
             except Exception as e:
                 warnings.warn(f"Watershed intersection failed: {e}")
                 stats['watershed_area_sum'] = 0
                 stats['watershed_features'] = 0
-        else:
-            stats['watershed_area_sum'] = 0
-            stats['watershed_features'] = 0
         
         # Custom layer intersections
         for layer_name, layer_gdf in self.custom_layers.items():
-            if not gdf_aoi.empty:
-                try:
-                    custom_intersect = gpd.overlay(
-                        gdf_aoi,
-                        layer_gdf,
-                        how='intersection'
-                    )
-                    
-                    stats[f'{layer_name}_features'] = len(custom_intersect)
-                    stats[f'{layer_name}_area_sum'] = float(custom_intersect.geometry.area.sum())
-                    
-                except Exception as e:
-                    warnings.warn(f"Custom layer '{layer_name}' intersection failed: {e}")
-                    stats[f'{layer_name}_features'] = 0
-                    stats[f'{layer_name}_area_sum'] = 0
-            else:
+            try:
+                aoi_geoms, custom_geoms, _ = self._join_layer(gdf_aoi, layer_gdf)
+                
+                stats[f'{layer_name}_features'] = len(custom_geoms)
+                stats[f'{layer_name}_area_sum'] = float(self._intersection_area(aoi_geoms, custom_geoms).sum())
+                
+            except Exception as e:
+                warnings.warn(f"Custom layer '{layer_name}' intersection failed: {e}")
                 stats[f'{layer_name}_features'] = 0
                 stats[f'{layer_name}_area_sum'] = 0
         
@@ -401,12 +785,58 @@ class ForecastProcessor:
         # Fetch data
         precip_data, ds = self.fetch_forecast_data(date, fxx)
         
-        # Generate AOIs
-        gdf_aoi = self.generate_aois(precip_data, ds, threshold)
+        return self._process_threshold(precip_data, ds, fxx, threshold, method)
+    
+    def _process_threshold(
+        self,
+        precip_data: np.ndarray,
+        ds: any,
+        fxx: int,
+        threshold: float,
+        method: str,
+        precip_max: Optional[float] = None,
+        mask: Optional[np.ndarray] = None,
+        gdf_aoi: Optional[gpd.GeoDataFrame] = None
+    ) -> Tuple[gpd.GeoDataFrame, Dict]:
+        """
+        Generate, clip and summarize AOIs for already-fetched forecast data.
         
-        # Clip to land if requested
-        if self.config.clip_to_land and self.land_boundary is not None and not gdf_aoi.empty:
-            gdf_aoi = self.data_manager.clip_to_land(gdf_aoi, self.land_boundary)
+        Parameters
+        ----------
+        precip_data : np.ndarray
+            Precipitation data array
+        ds : xarray.Dataset
+            Xarray dataset with coordinate info
+        fxx : int
+            Forecast hour
+        threshold : float
+            Precipitation threshold
+        method : str
+            Processing method ('standard' or 'enhanced')
+        precip_max : float, optional
+            Maximum of ``precip_data``; thresholds at or above it yield no
+            AOIs without labeling the grid
+        mask : np.ndarray, optional
+            Precomputed ``precip_data > threshold``
+        gdf_aoi : gpd.GeoDataFrame, optional
+            AOIs already generated and clipped for this threshold (by another
+            method); reused as is instead of labeling the grid again
+            
+        Returns
+        -------
+        tuple
+            (gdf_aoi, statistics_dict)
+        """
+        if gdf_aoi is None:
+            # Generate AOIs
+            if precip_max is not None and not precip_max > threshold:
+                gdf_aoi = self._empty_aois()
+            else:
+                gdf_aoi = self.generate_aois(precip_data, ds, threshold, mask=mask)
+            
+            # Clip to land if requested
+            if self.config.clip_to_land and self.land_boundary is not None and not gdf_aoi.empty:
+                gdf_aoi = self.data_manager.clip_to_land(gdf_aoi, self.land_boundary)
         
         # Statistics
         stats = {
@@ -429,6 +859,10 @@ class ForecastProcessor:
         """
         Process all forecasts according to configuration.
         
+        Each (date, forecast hour) pair is an independent job. When
+        ``config.n_workers`` is greater than 1 the jobs are distributed over
+        a process pool; otherwise they run serially in this process.
+        
         Returns
         -------
         dict
@@ -442,61 +876,75 @@ class ForecastProcessor:
         print(f"Forecast Hours: {self.config.fxx_list}")
         print(f"Thresholds: {self.config.thresholds}")
         print(f"Methods: {self.config.forecast_methods}")
+        print(f"Workers: {self.config.n_workers}")
         print(f"Output: {self.output_dir}")
         print("#"*70 + "\n")
         
-        # Initialize results structure
+        # Initialize results structure and output directories
         for method in self.config.forecast_methods:
             self.results[method] = {}
-        
-        # Loop over methods
-        for method in self.config.forecast_methods:
-            method_dir = self.output_dir / method
-            method_dir.mkdir(exist_ok=True)
-            
-            print(f"\n{'='*70}")
-            print(f"METHOD: {method.upper()}")
-            print(f"{'='*70}")
-            
-            # Loop over dates
             for date_str in self.config.forecast_dates:
-                date = datetime.strptime(date_str, "%Y-%m-%d")
-                date_dir = method_dir / date_str
-                date_dir.mkdir(exist_ok=True)
-                
+                date_dir = self.output_dir / method / date_str
+                date_dir.mkdir(parents=True, exist_ok=True)
                 self.results[method][date_str] = {}
+        
+        jobs = [
+            (date_str, fxx)
+            for date_str in self.config.forecast_dates
+            for fxx in self.config.fxx_list
+        ]
+        n_workers = min(self.config.n_workers, len(jobs), os.cpu_count() or 1)
+        self._batched_dates.clear()
+        
+        try:
+            if n_workers > 1:
+                # Workers rebuild their own processor from a plain-dict config,
+                # taking the already-loaded layers from shared memory
+                layers_shm = self._share_layers()
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=n_workers,
+                        initializer=_init_worker,
+                        initargs=(self.config.to_dict(), layers_shm.name if layers_shm else None)
+                    ) as executor:
+                        futures = [
+                            executor.submit(_process_one, date_str, fxx)
+                            for date_str, fxx in jobs
+                        ]
+                        for future in as_completed(futures):
+                            date_str, fxx, job_results = future.result()
+                            self._store_job_results(date_str, job_results)
+                finally:
+                    if layers_shm is not None:
+                        layers_shm.close()
+                        layers_shm.unlink()
+            elif self.config.prefetch_depth > 0:
+                # Fetch upcoming forecasts on a background thread while the
+                # current one is rasterized; the bounded queue caps memory
+                fetched = queue.Queue(maxsize=self.config.prefetch_depth)
+                producer = threading.Thread(
+                    target=self._prefetch_loop, args=(jobs, fetched), daemon=True
+                )
+                producer.start()
                 
-                print(f"\n--- Date: {date_str} ---")
+                while True:
+                    item = fetched.get()
+                    if item is None:
+                        break
+                    date_str, fxx, forecast = item
+                    job_results = self._process_forecast_hour(date_str, fxx, forecast)
+                    self._store_job_results(date_str, job_results)
                 
-                # Loop over forecast hours
-                for fxx in self.config.fxx_list:
-                    print(f"\n  Forecast Hour: F{fxx:02d}")
-                    
-                    # Loop over thresholds
-                    for threshold in self.config.thresholds:
-                        try:
-                            # Process this forecast
-                            gdf_aoi, stats = self.process_single_forecast(
-                                date, fxx, threshold, method
-                            )
-                            
-                            # Store statistics
-                            key = f"F{fxx}_T{int(threshold)}"
-                            self.results[method][date_str][key] = stats
-                            
-                            # Save AOI GeoJSON
-                            if self.config.save_aois:
-                                out_gdf_path = date_dir / f"{key}_aois.geojson"
-                                gdf_aoi.to_file(out_gdf_path, driver="GeoJSON")
-                            
-                            print(f"    T{int(threshold):3d}mm: {len(gdf_aoi):3d} AOIs | "
-                                  f"Mean precip: {stats['mean_precip_over_aois']:.1f}mm")
-                            
-                        except Exception as e:
-                            print(f"    T{int(threshold):3d}mm: ERROR - {e}")
-                            self.results[method][date_str][f"F{fxx}_T{int(threshold)}"] = {
-                                'error': str(e)
-                            }
+                producer.join()
+            else:
+                for date_str, fxx in jobs:
+                    self._batch_download_date(date_str)
+                    job_results = self._process_forecast_hour(date_str, fxx)
+                    self._store_job_results(date_str, job_results)
+        finally:
+            # Batch subsets whose forecast hour was never read (failed or
+            # skipped jobs) would otherwise be left behind in the cache
+            self._remove_batch_files()
         
         # Save summary
         self.save_summary()
@@ -507,6 +955,145 @@ class ForecastProcessor:
         
         return self.results
     
+    def _prefetch_loop(self, jobs: List[Tuple[str, int]], fetched: queue.Queue):
+        """
+        Fetch forecast data for each job and hand it to the consumer queue.
+        
+        Fetch failures are queued in place of the data so the consumer can
+        record them per threshold. A trailing ``None`` marks the end of jobs.
+        """
+        for date_str, fxx in jobs:
+            self._batch_download_date(date_str)
+            try:
+                date = datetime.strptime(date_str, "%Y-%m-%d")
+                forecast = self.fetch_forecast_data(date, fxx)
+            except Exception as e:
+                forecast = e
+            fetched.put((date_str, fxx, forecast))
+        
+        fetched.put(None)
+    
+    def _remove_batch_files(self):
+        """Delete batch-downloaded GRIB subsets that were never read."""
+        while self._batch_files:
+            self._batch_files.pop().unlink(missing_ok=True)
+    
+    def _batch_download_date(self, date_str: str):
+        """Batch-download every configured forecast hour of a date, once per run."""
+        if not self.config.batch_downloads or date_str in self._batched_dates:
+            return
+        
+        self._batched_dates.add(date_str)
+        self.download_forecast_batch(
+            datetime.strptime(date_str, "%Y-%m-%d"), self.config.fxx_list
+        )
+    
+    def _process_forecast_hour(
+        self,
+        date_str: str,
+        fxx: int,
+        forecast: Optional[Union[Tuple[np.ndarray, any], Exception]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Process every method and threshold for one date and forecast hour.
+        
+        Parameters
+        ----------
+        date_str : str
+            Forecast date (YYYY-MM-DD)
+        fxx : int
+            Forecast hour
+        forecast : tuple or Exception, optional
+            Prefetched ``(precip_data, ds)``, or the exception raised while
+            fetching it. Fetched here when not provided.
+            
+        Returns
+        -------
+        dict
+            Statistics keyed by method, then by ``F{fxx}_T{threshold}``
+        """
+        job_results = {method: {} for method in self.config.forecast_methods}
+        
+        # One fetch serves every method and threshold of this job
+        if forecast is None:
+            try:
+                date = datetime.strptime(date_str, "%Y-%m-%d")
+                forecast = self.fetch_forecast_data(date, fxx)
+            except Exception as e:
+                forecast = e
+        
+        print(f"\n--- Date: {date_str} | Forecast Hour: F{fxx:02d} ---")
+        
+        # Grid maximum, computed once, lets empty thresholds skip labeling;
+        # threshold levels, computed once, give every threshold's mask
+        precip_max = None
+        levels = sorted_thresholds = None
+        if not isinstance(forecast, Exception) and forecast[0].size:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN grid
+                precip_max = float(np.nanmax(forecast[0]))
+            levels, sorted_thresholds = self._threshold_levels(forecast[0])
+        
+        # AOIs depend only on the threshold, so methods share one labeling,
+        # polygonization and land clip per threshold
+        threshold_aois = {}
+        
+        # AOI files are written on background threads (GDAL releases the
+        # GIL) so the next threshold is labelled while the last one saves
+        writes = {}
+        with ThreadPoolExecutor(max_workers=4) as writer:
+            for method in self.config.forecast_methods:
+                date_dir = self.output_dir / method / date_str
+                
+                for threshold in self.config.thresholds:
+                    key = f"F{fxx}_T{int(threshold)}"
+                    
+                    try:
+                        if isinstance(forecast, Exception):
+                            raise forecast
+                        
+                        # Process this forecast
+                        precip_data, ds = forecast
+                        mask = None
+                        if levels is not None and threshold not in threshold_aois:
+                            k = int(np.searchsorted(sorted_thresholds, threshold))
+                            mask = levels > k
+                        gdf_aoi, stats = self._process_threshold(
+                            precip_data, ds, fxx, threshold, method, precip_max, mask,
+                            gdf_aoi=threshold_aois.get(threshold)
+                        )
+                        threshold_aois[threshold] = gdf_aoi
+                        job_results[method][key] = stats
+                        
+                        # Save AOI file
+                        if self.config.save_aois:
+                            suffix = AOI_SUFFIXES[self.config.aoi_format]
+                            writes[method, key, threshold] = writer.submit(
+                                write_aoi_file, gdf_aoi, date_dir / f"{key}_aois{suffix}"
+                            )
+                        
+                        print(f"    {method:>8s} T{int(threshold):3d}mm: {len(gdf_aoi):3d} AOIs | "
+                              f"Mean precip: {stats['mean_precip_over_aois']:.1f}mm")
+                        
+                    except Exception as e:
+                        print(f"    {method:>8s} T{int(threshold):3d}mm: ERROR - {e}")
+                        job_results[method][key] = {'error': str(e)}
+        
+        # A failed write marks its threshold as failed, as a synchronous one did
+        for (method, key, threshold), future in writes.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"    {method:>8s} T{int(threshold):3d}mm: ERROR - {e}")
+                job_results[method][key] = {'error': str(e)}
+        
+        return job_results
+    
+    def _store_job_results(self, date_str: str, job_results: Dict[str, Dict]):
+        """Merge one job's per-method statistics into ``self.results``."""
+        for method, method_stats in job_results.items():
+            self.results[method][date_str].update(method_stats)
+    
     def save_summary(self):
         """Save results summary to JSON."""
         summary_path = self.output_dir / "experiment_summary.json"
@@ -518,7 +1105,7 @@ class ForecastProcessor:
     
     def get_aoi_files(self) -> List[Path]:
         """
-        Get list of all generated AOI GeoJSON files.
+        Get list of all generated AOI files.
         
         Returns
         -------
@@ -537,11 +1124,36 @@ class ForecastProcessor:
                 if not date_dir.exists():
                     continue
                 
-                aoi_files.extend(date_dir.glob("*_aois.geojson"))
+                for suffix in AOI_SUFFIXES.values():
+                    aoi_files.extend(date_dir.glob(f"*_aois{suffix}"))
         
         return sorted(aoi_files)
 
 
+# Process pool workers
+_WORKER_PROCESSOR: Optional[ForecastProcessor] = None
+
+
+def _init_worker(config_dict: Dict, layers_shm_name: Optional[str] = None):
+    """Build the ForecastProcessor owned by a pool worker process."""
+    global _WORKER_PROCESSOR
+    
+    layers = None
+    if layers_shm_name is not None:
+        shm = SharedMemory(name=layers_shm_name)
+        try:
+            layers = pickle.loads(shm.buf)
+        finally:
+            shm.close()
+    
+    _WORKER_PROCESSOR = ForecastProcessor(ForecastConfig.from_dict(config_dict), layers=layers)
+
+
+def _process_one(date_str: str, fxx: int) -> Tuple[str, int, Dict]:
+    """Run a single (date, forecast hour) job inside a pool worker."""
+    return date_str, fxx, _WORKER_PROCESSOR._process_forecast_hour(date_str, fxx)
+
+
 # Convenience functions
 def process_forecast_dates(
     config: ForecastConfig
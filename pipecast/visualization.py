@@ -2,23 +2,287 @@
 Visualization utilities for PIPECAST.
 """
 
+import importlib.util
+import json
 import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from string import Template
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 import warnings
 
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import geopandas as gpd
+import shapely
+
+from .data_manager import (
+    AOI_SUFFIXES, WGS84, _to_crs_cached, read_aoi_feature_count, read_aoi_file, write_aoi_file
+)
+
+# matplotlib and folium are imported where they are used, so importing
+# this module stays cheap for code that only needs the file helpers
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 # Optional dependencies
-try:
-    import folium
-    from folium.raster_layers import ImageOverlay
-    FOLIUM_AVAILABLE = True
-except ImportError:
-    FOLIUM_AVAILABLE = False
+FOLIUM_AVAILABLE = importlib.util.find_spec("folium") is not None
+if not FOLIUM_AVAILABLE:
     warnings.warn("folium not available - interactive maps disabled")
 
+# Upper bound on concurrent AOI file reads
+MAX_READ_WORKERS = 16
+
+# Matplotlib backends that cannot display figures
+NON_INTERACTIVE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+# Interactive map geometries are snapped to this grid (degrees, ~1 m) and
+# simplified with this tolerance (~10 m) before being embedded in the HTML
+MAP_PRECISION = 1e-5
+MAP_SIMPLIFY_TOLERANCE = 1e-4
+
+# Style shared by every AOI feature on interactive maps
+AOI_STYLE = {
+    'fillColor': '#3186cc',
+    'color': '#3186cc',
+    'weight': 1,
+    'fillOpacity': 0.3
+}
+
+
+def _aoi_style(feature) -> dict:
+    """Folium style function returning the constant ``AOI_STYLE``."""
+    return AOI_STYLE
+
+
+# MapLibre page over the PMTiles pyramid written by build_vector_tile_map;
+# the date selector filters the single 'aois' tile layer client-side
+VECTOR_TILE_HTML = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>PIPECAST AOIs</title>
+<link href="https://unpkg.com/maplibre-gl@4.7.1/dist/maplibre-gl.css" rel="stylesheet">
+<script src="https://unpkg.com/maplibre-gl@4.7.1/dist/maplibre-gl.js"></script>
+<script src="https://unpkg.com/pmtiles@3.2.1/dist/pmtiles.js"></script>
+<style>
+body { margin: 0; }
+#map { position: absolute; top: 0; bottom: 0; width: 100%; }
+#date { position: absolute; top: 10px; left: 10px; z-index: 1; }
+</style>
+</head>
+<body>
+<select id="date"></select>
+<div id="map"></div>
+<script>
+const dates = $dates;
+const protocol = new pmtiles.Protocol();
+maplibregl.addProtocol("pmtiles", protocol.tile);
+const map = new maplibregl.Map({
+  container: "map",
+  style: "https://basemaps.cartocdn.com/gl/positron-gl-style/style.json",
+  center: [$lon, $lat],
+  zoom: $zoom
+});
+const select = document.getElementById("date");
+for (const d of dates) select.add(new Option(d, d));
+map.on("load", () => {
+  map.addSource("aois", {type: "vector", url: "pmtiles://$pmtiles"});
+  map.addLayer({
+    id: "aois",
+    type: "fill",
+    source: "aois",
+    "source-layer": "aois",
+    paint: {"fill-color": "$color", "fill-outline-color": "$color", "fill-opacity": $opacity},
+    filter: ["==", ["get", "date"], dates[0]]
+  });
+  select.onchange = () => map.setFilter("aois", ["==", ["get", "date"], select.value]);
+});
+</script>
+</body>
+</html>
+""")
+
+
+@lru_cache(maxsize=4096)
+def _cached_aoi(
+    path: str,
+    mtime_ns: int,
+    columns: Optional[Tuple[str, ...]]
+) -> gpd.GeoDataFrame:
+    """Read (once per file version) the AOIs behind ``_load_aoi``."""
+    # Thresholds that produced nothing are common; their files are
+    # recognized from metadata alone
+    if read_aoi_feature_count(path) == 0:
+        return gpd.GeoDataFrame(geometry=gpd.GeoSeries([], crs=WGS84))
+    return read_aoi_file(path, columns=columns)
+
+
+def _load_aoi(
+    path: Path,
+    columns: Optional[Sequence[str]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Read an AOI file, reusing the result while the file is unchanged.
+    
+    The cache is keyed on the file's modification time, so rewritten
+    outputs are read again. The returned frame is shared between callers
+    and must not be modified in place.
+    
+    Parameters
+    ----------
+    path : Path
+        AOI file
+    columns : sequence of str, optional
+        Attribute columns to read; an empty sequence reads geometry only
+        
+    Returns
+    -------
+    gpd.GeoDataFrame
+        AOIs, in the file's CRS (see ``_concat_wgs84``)
+    """
+    path = Path(path)
+    if columns is not None:
+        columns = tuple(columns)
+    return _cached_aoi(str(path), path.stat().st_mtime_ns, columns)
+
+
+def _concat_wgs84(frames: List[gpd.GeoDataFrame]) -> gpd.GeoDataFrame:
+    """
+    Concatenate AOI frames in EPSG:4326.
+    
+    Frames are grouped by CRS and each group is reprojected in one batch,
+    so many small files in the same projection share a single transform
+    pass; frames already in EPSG:4326 are not transformed.
+    
+    Parameters
+    ----------
+    frames : list of gpd.GeoDataFrame
+        Non-empty AOI frames with a CRS set
+        
+    Returns
+    -------
+    gpd.GeoDataFrame
+        All AOIs in EPSG:4326
+    """
+    by_crs: Dict = {}
+    for frame in frames:
+        by_crs.setdefault(frame.crs, []).append(frame)
+    
+    parts = []
+    for crs, group in by_crs.items():
+        combined = pd.concat(group, ignore_index=True)
+        if crs != WGS84:
+            combined = _to_crs_cached(combined, WGS84)
+        parts.append(combined)
+    return pd.concat(parts, ignore_index=True)
+
+
+def _new_figure(figsize: Tuple[float, float], show: bool = False) -> "Figure":
+    """
+    Create a figure, bypassing pyplot unless it is going to be shown.
+    
+    Figures that are only saved are attached straight to an Agg canvas, so
+    they never enter pyplot's figure registry or touch the GUI backend.
+    """
+    if show:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize)
+    
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _boundary_segments(geoms: np.ndarray) -> List[np.ndarray]:
+    """
+    Outline coordinates of polygons as one (n, 2) array per ring.
+    
+    All coordinates are extracted in a single shapely call and split by
+    ring, so the result can be drawn as one ``LineCollection``.
+    """
+    geoms = np.asarray(geoms)
+    geoms = geoms[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+    rings = shapely.get_parts(shapely.boundary(geoms))
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    split_at = np.flatnonzero(np.diff(ring_index)) + 1
+    return np.split(coords, split_at)
+
+
+def _plot_boundaries(ax, gdf: gpd.GeoDataFrame):
+    """Draw AOI outlines on ``ax`` with a single line artist."""
+    from matplotlib.collections import LineCollection
+    ax.add_collection(LineCollection(
+        _boundary_segments(gdf.geometry.values), colors='blue', linewidths=0.5
+    ))
+    ax.autoscale_view()
+
+
+def _feature_collection_json(geoms: np.ndarray, sources: Sequence[str]) -> str:
+    """
+    Serialize geometries and their ``source`` labels as a GeoJSON string.
+    
+    Geometries are encoded by ``shapely.to_geojson`` in one vectorized call
+    and the features are joined as text, skipping GeoPandas' per-feature
+    dict building.
+    """
+    geoms_json = shapely.to_geojson(geoms)
+    labels_json = {source: json.dumps(source) for source in set(sources)}
+    features = ",".join(
+        f'{{"type":"Feature","properties":{{"source":{labels_json[source]}}},"geometry":{geom}}}'
+        for geom, source in zip(geoms_json, sources)
+        if geom is not None
+    )
+    return f'{{"type":"FeatureCollection","features":[{features}]}}'
+
+
+def _find_aoi_files(root_dir: Path) -> List[Tuple[str, str, Path]]:
+    """
+    List the AOI outputs under ``root_dir/<method>/<date>/`` in one walk.
+    
+    Parameters
+    ----------
+    root_dir : Path
+        Root directory with forecast outputs
+        
+    Returns
+    -------
+    list of tuple
+        (method, date, path) for every AOI file, sorted by path
+    """
+    root_dir = Path(root_dir)
+    found = []
+    for path in sorted(root_dir.rglob("*_aois.*")):
+        parts = path.relative_to(root_dir).parts
+        if len(parts) != 3 or parts[0] == "ensemble_probability":
+            continue
+        if path.suffix not in AOI_SUFFIXES.values():
+            continue
+        found.append((parts[0], parts[1], path))
+    return found
+
+
+def _files_by_date(aoi_files: List[Tuple[str, str, Path]]) -> Dict[str, List[Tuple[str, Path]]]:
+    """Group ``_find_aoi_files`` results as {date: [(method, path), ...]}."""
+    grouped: Dict[str, List[Tuple[str, Path]]] = {}
+    for method, date, path in aoi_files:
+        grouped.setdefault(date, []).append((method, path))
+    return grouped
+
+
+def _try_read_aoi(path: Path) -> Tuple[Optional[gpd.GeoDataFrame], Optional[Exception]]:
+    """Read an AOI file's geometry, returning the error instead of raising it."""
+    try:
+        return _load_aoi(path, columns=()), None
+    except Exception as e:
+        return None, e
+
 
 def plot_aois_grid(
     geojson_files: List[Path],
@@ -26,11 +290,17 @@ def plot_aois_grid(
     batch_size: int = 16,
     n_cols: int = 4,
     figsize_per_plot: Tuple[int, int] = (4, 4),
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    interactive: Optional[bool] = None
 ):
     """
     Plot AOIs in a grid layout.
     
+    Batches are shown whenever the matplotlib backend can display them
+    (including notebook inline backends); the pause between batches is
+    only made when stdin is a terminal, so scripted runs that save to
+    ``output_dir`` write every batch without prompting.
+    
     Parameters
     ----------
     geojson_files : list of Path
@@ -45,9 +315,26 @@ def plot_aois_grid(
         Figure size per subplot
     output_dir : Path, optional
         Directory to save figures
+    interactive : bool, optional
+        Show each batch and wait for Enter before the next. By default
+        batches are shown when the matplotlib backend can display figures,
+        and the wait is made only when stdin is also a terminal
     """
     n_files = len(geojson_files)
     
+    # Nothing can be displayed under a non-interactive backend such as Agg;
+    # notebooks display inline but have no terminal to press Enter in
+    if interactive is None:
+        import matplotlib
+        show = matplotlib.get_backend().lower() not in NON_INTERACTIVE_BACKENDS
+        pause = show and sys.stdin.isatty()
+    else:
+        show = pause = interactive
+    
+    # Saved-only batches redraw one figure, sized by the first (largest)
+    # batch; displayed figures belong to pyplot and are rebuilt per batch
+    fig = None
+    
     for start_idx in range(0, n_files, batch_size):
         end_idx = min(start_idx + batch_size, n_files)
         batch_files = geojson_files[start_idx:end_idx]
@@ -55,30 +342,38 @@ def plot_aois_grid(
         
         n_rows = (len(batch_files) + n_cols - 1) // n_cols
         
-        fig, axes = plt.subplots(
-            n_rows, n_cols,
-            figsize=(figsize_per_plot[0] * n_cols, figsize_per_plot[1] * n_rows)
-        )
-        axes = axes.flatten() if n_rows * n_cols > 1 else [axes]
+        # Read the whole batch up front; pyogrio releases the GIL while GDAL
+        # parses, so the files decode concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(batch_files))) as executor:
+            batch_gdfs = list(executor.map(_try_read_aoi, batch_files))
+        
+        if fig is None or show:
+            fig = _new_figure(
+                (figsize_per_plot[0] * n_cols, figsize_per_plot[1] * n_rows),
+                show=show
+            )
+            axes = fig.subplots(n_rows, n_cols, squeeze=False).ravel()
+            # Fixed spacing (room for the axis labels only; ticks are hidden)
+            fig.subplots_adjust(wspace=0.15, hspace=0.15)
+        else:
+            for ax in axes:
+                ax.cla()
         
-        for idx, (gjson, label) in enumerate(zip(batch_files, batch_labels)):
+        for idx, ((gdf, error), label) in enumerate(zip(batch_gdfs, batch_labels)):
             ax = axes[idx]
+            ax.set_visible(True)
             
-            try:
-                gdf = gpd.read_file(gjson)
-                
-                if not gdf.empty:
-                    gdf.boundary.plot(ax=ax, color='blue', linewidth=0.5)
-                    ax.set_aspect('equal')
-                else:
-                    ax.text(0.5, 0.5, 'No AOIs', ha='center', va='center',
-                           transform=ax.transAxes, fontsize=10)
-                    ax.set_aspect('auto')
-                    
-            except Exception as e:
-                ax.text(0.5, 0.5, f'Error:\n{str(e)[:30]}', ha='center', va='center',
+            if error is not None:
+                ax.text(0.5, 0.5, f'Error:\n{str(error)[:30]}', ha='center', va='center',
                        transform=ax.transAxes, fontsize=8, color='red')
                 ax.set_aspect('auto')
+            elif not gdf.empty:
+                _plot_boundaries(ax, gdf)
+                ax.set_aspect('equal')
+            else:
+                ax.text(0.5, 0.5, 'No AOIs', ha='center', va='center',
+                       transform=ax.transAxes, fontsize=10)
+                ax.set_aspect('auto')
             
             ax.set_title(label, fontsize=8)
             ax.set_xticks([])
@@ -86,20 +381,21 @@ def plot_aois_grid(
         
         # Hide unused axes
         for j in range(len(batch_files), len(axes)):
-            axes[j].axis('off')
-        
-        plt.tight_layout()
+            axes[j].set_visible(False)
         
         if output_dir:
             output_dir.mkdir(parents=True, exist_ok=True)
             output_file = output_dir / f"aoi_grid_batch_{start_idx//batch_size + 1}.png"
-            plt.savefig(output_file, dpi=150, bbox_inches='tight')
+            fig.savefig(output_file, dpi=150, bbox_inches='tight')
             print(f"✓ Saved: {output_file}")
         
-        plt.show()
+        if show:
+            import matplotlib.pyplot as plt
+            plt.show()
+            plt.close(fig)
         
         # Pause between batches
-        if end_idx < n_files:
+        if pause and end_idx < n_files:
             input(f"Displayed {end_idx}/{n_files} plots. Press Enter to continue...")
 
 
@@ -108,7 +404,8 @@ def create_interactive_map(
     target_date: str,
     output_path: Optional[Path] = None,
     center: Optional[Tuple[float, float]] = None,
-    zoom_start: int = 6
+    zoom_start: int = 6,
+    prebuilt_files: Optional[List[Tuple[str, Path]]] = None
 ) -> Optional[any]:
     """
     Create interactive Folium map for a specific date.
@@ -125,6 +422,9 @@ def create_interactive_map(
         Map center (lat, lon)
     zoom_start : int
         Initial zoom level
+    prebuilt_files : list of tuple, optional
+        (method, path) of the date's AOI files, already collected by the
+        caller; the output directory is not scanned when given
         
     Returns
     -------
@@ -135,6 +435,8 @@ def create_interactive_map(
         print("Folium not available - cannot create interactive map")
         return None
     
+    import folium
+    
     # Default center
     if center is None:
         center = [39.0, -98.0]  # Center of US
@@ -146,45 +448,57 @@ def create_interactive_map(
         tiles="CartoDB positron"
     )
     
-    # Add AOIs for target date
+    # Add AOIs for target date, one layer per method; each feature keeps the
+    # file it came from in a 'source' column for its tooltip
     aoi_count = 0
+    layer_count = 0
     
-    for method_dir in root_dir.iterdir():
-        if not method_dir.is_dir() or method_dir.name == "ensemble_probability":
-            continue
-        
-        date_dir = method_dir / target_date
-        if not date_dir.exists():
-            continue
-        
-        for file in date_dir.glob("*.geojson"):
+    if prebuilt_files is None:
+        prebuilt_files = [
+            (file.parent.parent.name, file)
+            for file in sorted(Path(root_dir).glob(f"*/{target_date}/*_aois.*"))
+            if file.parent.parent.name != "ensemble_probability"
+            and file.suffix in AOI_SUFFIXES.values()
+        ]
+    
+    files_by_method: Dict[str, List[Path]] = {}
+    for method, file in prebuilt_files:
+        files_by_method.setdefault(method, []).append(file)
+    
+    for method, files in files_by_method.items():
+        method_gdfs = []
+        for file in files:
             try:
-                gdf_aoi = gpd.read_file(file)
+                gdf_aoi = _load_aoi(file)
                 if gdf_aoi.empty:
                     continue
+                if gdf_aoi.crs is None:
+                    raise ValueError("no CRS to convert to EPSG:4326 from")
                 
-                # Ensure WGS84
-                gdf_aoi = gdf_aoi.to_crs("EPSG:4326")
-                
-                popup_label = f"{method_dir.name} | {target_date} | {file.stem}"
-                
-                folium.GeoJson(
-                    gdf_aoi,
-                    name=popup_label,
-                    tooltip=popup_label,
-                    style_function=lambda x: {
-                        'fillColor': '#3186cc',
-                        'color': '#3186cc',
-                        'weight': 1,
-                        'fillOpacity': 0.3
-                    }
-                ).add_to(m)
-                
+                popup_label = f"{method} | {target_date} | {file.stem}"
+                method_gdfs.append(gdf_aoi.assign(source=popup_label))
                 aoi_count += 1
                 
             except Exception as e:
                 warnings.warn(f"Failed to add {file}: {e}")
                 continue
+        
+        if not method_gdfs:
+            continue
+        
+        # Snap and simplify before embedding: the serialized coordinates are
+        # most of the page size
+        combined = _concat_wgs84(method_gdfs)
+        geoms = shapely.set_precision(np.asarray(combined.geometry.values), MAP_PRECISION)
+        geoms = shapely.simplify(geoms, MAP_SIMPLIFY_TOLERANCE, preserve_topology=True)
+        folium.GeoJson(
+            _feature_collection_json(geoms, combined['source'].tolist()),
+            name=method,
+            tooltip=folium.GeoJsonTooltip(fields=['source'], labels=False),
+            style_function=_aoi_style,
+            smooth_factor=2.0
+        ).add_to(m)
+        layer_count += 1
     
     # Add layer control
     folium.LayerControl().add_to(m)
@@ -195,11 +509,105 @@ def create_interactive_map(
         m.save(output_path)
         print(f"✓ Interactive map saved: {output_path}")
     
-    print(f"✓ Added {aoi_count} AOI layers to map")
+    print(f"✓ Added {aoi_count} AOI files to map in {layer_count} layers")
     
     return m
 
 
+def build_vector_tile_map(
+    root_dir: Path,
+    output_dir: Path,
+    center: Optional[Tuple[float, float]] = None,
+    zoom_start: int = 4
+) -> Optional[Path]:
+    """
+    Build one map page for all dates over a vector tile pyramid.
+    
+    All AOIs are gathered into a single GeoJSON with ``date``, ``method``
+    and ``source`` properties and tiled by tippecanoe into
+    ``aois.pmtiles``. ``aois_map.html`` renders the tiles with MapLibre
+    and filters them by the selected date, so the browser only draws the
+    visible tiles instead of every AOI inline. PMTiles are read with HTTP
+    range requests: serve ``output_dir`` over HTTP (e.g.
+    ``python -m http.server``) rather than opening the page as a file.
+    
+    Parameters
+    ----------
+    root_dir : Path
+        Root directory with forecast outputs
+    output_dir : Path
+        Directory for the tiles and page
+    center : tuple, optional
+        Map center (lat, lon)
+    zoom_start : int
+        Initial zoom level
+        
+    Returns
+    -------
+    Path or None
+        Path to the HTML page, or None if tippecanoe is not installed or
+        there are no AOIs
+    """
+    tippecanoe = shutil.which("tippecanoe")
+    if tippecanoe is None:
+        print("tippecanoe not available - cannot build vector tile map")
+        return None
+    
+    if center is None:
+        center = (39.0, -98.0)  # Center of US
+    
+    root_dir = Path(root_dir)
+    output_dir = Path(output_dir)
+    
+    frames = []
+    for method, date, file in _find_aoi_files(root_dir):
+        try:
+            gdf_aoi = _load_aoi(file)
+            if not gdf_aoi.empty and gdf_aoi.crs is None:
+                raise ValueError("no CRS to convert to EPSG:4326 from")
+        except Exception as e:
+            warnings.warn(f"Failed to add {file}: {e}")
+            continue
+        if gdf_aoi.empty:
+            continue
+        
+        frames.append(gdf_aoi.assign(
+            date=date,
+            method=method,
+            source=f"{method} | {date} | {file.stem}"
+        ))
+    
+    if not frames:
+        print("No AOIs found for vector tile map")
+        return None
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    combined = _concat_wgs84(frames)
+    geojson_path = output_dir / "aois.geojson"
+    pmtiles_path = output_dir / "aois.pmtiles"
+    write_aoi_file(combined, geojson_path)
+    
+    # -zg picks the max zoom from feature density
+    subprocess.run([
+        tippecanoe, "-zg", "--drop-densest-as-needed", "--force", "--quiet",
+        "-l", "aois", "-o", str(pmtiles_path), str(geojson_path)
+    ], check=True)
+    
+    html_path = output_dir / "aois_map.html"
+    html_path.write_text(VECTOR_TILE_HTML.substitute(
+        dates=json.dumps(sorted(combined['date'].unique().tolist())),
+        lon=center[1],
+        lat=center[0],
+        zoom=zoom_start,
+        pmtiles=pmtiles_path.name,
+        color=AOI_STYLE['fillColor'],
+        opacity=AOI_STYLE['fillOpacity']
+    ), encoding="utf-8")
+    print(f"✓ Vector tile map saved: {html_path}")
+    
+    return html_path
+
+
 def visualize_forecast_outputs(root_dir: str):
     """
     Create standard visualizations for forecast outputs.
@@ -215,22 +623,10 @@ def visualize_forecast_outputs(root_dir: str):
     print("CREATING VISUALIZATIONS")
     print("="*70)
     
-    # Collect all GeoJSON files
-    geojson_files = []
-    labels = []
-    
-    for method_dir in root_path.iterdir():
-        if not method_dir.is_dir() or method_dir.name == "ensemble_probability":
-            continue
-        
-        for date_dir in method_dir.iterdir():
-            if not date_dir.is_dir():
-                continue
-            
-            for file in date_dir.glob("*.geojson"):
-                geojson_files.append(file)
-                label = f"{method_dir.name} | {date_dir.name} | {file.stem}"
-                labels.append(label)
+    # Collect all AOI files
+    aoi_files = _find_aoi_files(root_path)
+    geojson_files = [file for _, _, file in aoi_files]
+    labels = [f"{method} | {date} | {file.stem}" for method, date, file in aoi_files]
     
     if not geojson_files:
         print("No GeoJSON files found for visualization")
@@ -246,19 +642,19 @@ def visualize_forecast_outputs(root_dir: str):
     
     # Create interactive maps for each date (if folium available)
     if FOLIUM_AVAILABLE:
-        dates = set()
-        for label in labels:
-            parts = label.split("|")
-            if len(parts) >= 2:
-                dates.add(parts[1].strip())
-        
-        for date in sorted(dates):
+        for date, date_files in sorted(_files_by_date(aoi_files).items()):
             map_path = viz_dir / f"map_{date}.html"
-            create_interactive_map(root_path, date, map_path)
+            create_interactive_map(root_path, date, map_path, prebuilt_files=date_files)
     
     print("="*70 + "\n")
 
 
+def _build_date_map(args: Tuple[Path, str, Path, List[Tuple[str, Path]]]):
+    """Process-pool entry point: build and save one date's interactive map."""
+    root_dir, date, map_path, date_files = args
+    create_interactive_map(root_dir, date, map_path, prebuilt_files=date_files)
+
+
 class ForecastVisualizer:
     """
     Comprehensive visualization class for PIPECAST outputs.
@@ -288,64 +684,97 @@ class ForecastVisualizer:
         fxx : int
             Forecast hour
         """
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        axes = axes.flatten()
+        fig = _new_figure((18, 12))
+        axes = fig.subplots(2, 3).ravel()
         
         thresholds = [5, 39, 50, 100, 254, 255]
         
+        # List each method's date directory once; the first method (and,
+        # within it, the first AOI format) holding a threshold's file wins
+        prefix = f"F{fxx}_T"
+        suffix_rank = {suffix: rank for rank, suffix in enumerate(AOI_SUFFIXES.values())}
+        candidates: Dict[str, Path] = {}
+        for method_dir in self.root_dir.iterdir():
+            date_dir = method_dir / date
+            if not date_dir.is_dir():
+                continue
+            method_files = sorted(
+                (p for p in date_dir.glob(f"{prefix}*_aois.*") if p.suffix in suffix_rank),
+                key=lambda p: suffix_rank[p.suffix]
+            )
+            for p in method_files:
+                candidates.setdefault(p.stem[len(prefix):-len("_aois")], p)
+        
         for idx, threshold in enumerate(thresholds):
             ax = axes[idx]
             
             # Find matching file
-            pattern = f"F{fxx}_T{threshold}_aois.geojson"
-            
-            for method_dir in self.root_dir.iterdir():
-                if not method_dir.is_dir():
-                    continue
-                
-                file_path = method_dir / date / pattern
-                if file_path.exists():
-                    try:
-                        gdf = gpd.read_file(file_path)
-                        if not gdf.empty:
-                            gdf.boundary.plot(ax=ax, color='blue', linewidth=0.5)
-                            ax.set_title(f"Threshold: {threshold}mm\n{len(gdf)} AOIs",
-                                       fontsize=10)
-                        else:
-                            ax.set_title(f"Threshold: {threshold}mm\nNo AOIs",
-                                       fontsize=10)
-                    except:
-                        ax.set_title(f"Threshold: {threshold}mm\nError", fontsize=10)
-                    break
+            file_path = candidates.get(str(threshold))
+            if file_path is not None:
+                try:
+                    # Only the outlines are drawn, so skip the attributes
+                    gdf = _load_aoi(file_path, columns=())
+                    if not gdf.empty:
+                        _plot_boundaries(ax, gdf)
+                        ax.set_title(f"Threshold: {threshold}mm\n{len(gdf)} AOIs",
+                                   fontsize=10)
+                    else:
+                        ax.set_title(f"Threshold: {threshold}mm\nNo AOIs",
+                                   fontsize=10)
+                except:
+                    ax.set_title(f"Threshold: {threshold}mm\nError", fontsize=10)
             
             ax.set_aspect('equal')
             ax.set_xticks([])
             ax.set_yticks([])
         
-        plt.suptitle(f"Threshold Comparison - {date} F{fxx:02d}", fontsize=14, y=1.0)
-        plt.tight_layout()
+        fig.suptitle(f"Threshold Comparison - {date} F{fxx:02d}", fontsize=14, y=1.0)
+        fig.subplots_adjust(wspace=0.1, hspace=0.2)
         
         output_file = self.viz_dir / f"threshold_comparison_{date}_F{fxx:02d}.png"
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight')
         print(f"✓ Saved: {output_file}")
-        plt.close()
     
-    def create_all_date_maps(self):
-        """Create interactive maps for all dates."""
+    def create_all_date_maps(self, n_workers: Optional[int] = None):
+        """
+        Create interactive maps for all dates.
+        
+        With tippecanoe installed this builds one vector tile map covering
+        every date (see ``build_vector_tile_map``); otherwise one Folium
+        map is written per date.
+        
+        Parameters
+        ----------
+        n_workers : int, optional
+            Worker processes for the per-date Folium maps (default: one
+            per CPU); 1 builds them serially
+        """
+        if shutil.which("tippecanoe") is not None:
+            build_vector_tile_map(self.root_dir, self.viz_dir)
+            return
+        
         if not FOLIUM_AVAILABLE:
             print("Folium not available - skipping interactive maps")
             return
         
-        dates = set()
+        files_by_date = _files_by_date(_find_aoi_files(self.root_dir))
+        jobs = [
+            (self.root_dir, date, self.viz_dir / f"map_{date}.html", date_files)
+            for date, date_files in sorted(files_by_date.items())
+        ]
         
-        for method_dir in self.root_dir.iterdir():
-            if not method_dir.is_dir():
-                continue
-            
-            for date_dir in method_dir.iterdir():
-                if date_dir.is_dir():
-                    dates.add(date_dir.name)
+        # Dates are independent, and reading plus HTML rendering is
+        # Python-bound, so separate processes scale where threads would not
+        n_workers = min(n_workers or os.cpu_count() or 1, len(jobs))
+        if n_workers <= 1:
+            for job in jobs:
+                _build_date_map(job)
+            return
         
-        for date in sorted(dates):
-            map_path = self.viz_dir / f"map_{date}.html"
-            create_interactive_map(self.root_dir, date, map_path)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(_build_date_map, job): job[1] for job in jobs}
+            for future, date in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    warnings.warn(f"Failed to create map for {date}: {e}")
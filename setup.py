@@ -26,19 +26,24 @@ setup(
     install_requires=[
         "numpy>=1.20.0",
         "pandas>=1.3.0",
-        "geopandas>=0.10.0",
-        "shapely>=1.8.0",
-        "rasterio>=1.2.0",
+        "geopandas>=0.13.0",
+        "shapely>=2.0.0",
+        "rasterio>=1.3.0",
         "scipy>=1.7.0",
-        "herbie-data>=0.0.10",
+        "herbie-data>=2023.3.0",
         "xarray>=0.19.0",
-        "requests>=2.26.0",
+        "urllib3>=1.26.0",
         "tqdm>=4.62.0",
     ],
     extras_require={
         'viz': [
             'matplotlib>=3.3.0',
             'folium>=0.12.0',
+            'pyogrio>=0.7.0',
+        ],
+        'fast': [
+            'rusterize>=0.9.0',
+            'connected-components-3d>=3.12.0',
         ],
     },
     project_urls={
@@ -0,0 +1,45 @@
+"""Round trips of AOI files through write_aoi_file and the AOI readers."""
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from pipecast.data_manager import (
+    AOI_SUFFIXES, WGS84, read_aoi_bounds, read_aoi_feature_count, read_aoi_file, write_aoi_file
+)
+
+
+@pytest.fixture(params=sorted(AOI_SUFFIXES))
+def aoi_path(request, tmp_path):
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    return tmp_path / f"F0_T5_aois{AOI_SUFFIXES[request.param]}"
+
+
+def _aois():
+    return gpd.GeoDataFrame(
+        {"aoi_id": [1, 2], "area_km2": [10.0, 20.0]},
+        geometry=[box(-100, 35, -99, 36), box(-98, 36, -97, 37)],
+        crs=WGS84
+    )
+
+
+def test_round_trip(aoi_path):
+    write_aoi_file(_aois(), aoi_path)
+
+    gdf = read_aoi_file(aoi_path)
+    assert len(gdf) == 2
+    assert gdf.crs == WGS84
+    assert read_aoi_feature_count(aoi_path) in (2, None)
+    assert read_aoi_bounds(aoi_path) == pytest.approx((-100, 35, -97, 37))
+
+
+def test_empty_round_trip(aoi_path):
+    # Thresholds that no grid cell exceeds produce empty AOI files
+    write_aoi_file(_aois().iloc[:0], aoi_path)
+
+    gdf = read_aoi_file(aoi_path)
+    assert gdf.empty
+    assert gdf.crs == WGS84
+    assert read_aoi_feature_count(aoi_path) in (0, None)
+    assert read_aoi_bounds(aoi_path) is None